@@ -7,7 +7,12 @@ dynamically.
 
 import re
 import json
-from typing import List
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+from Backend.utils import loads
 
 try:
     import g4f  # type: ignore
@@ -15,6 +20,11 @@ except ImportError:
     g4f = None
     print("Warning: g4f is not installed. Some features may not work.")
 
+try:
+    import diskcache  # type: ignore
+except ImportError:
+    diskcache = None
+
 try:
     from termcolor import colored
 except ImportError:
@@ -32,6 +42,90 @@ except ImportError:
         return text
 
 
+_ARRAY_START_RE = re.compile(r"\[")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_first_json_array(text: str) -> Optional[list]:
+    """
+    Return the first valid JSON array found in text, or None.
+    Candidate positions are found with a regex and each one is parsed with
+    JSONDecoder.raw_decode, which avoids the greedy backtracking of a
+    bracket-matching regex on multi-line output.
+    """
+    for match in _ARRAY_START_RE.finditer(text):
+        try:
+            value, _ = _JSON_DECODER.raw_decode(text, match.start())
+        except json.JSONDecodeError:
+            continue
+        if isinstance(value, list):
+            return value
+    return None
+
+
+# Cache of GPT responses, keyed on a hash of the model and prompt inputs.
+# Kept in memory for the process lifetime and, when diskcache is available,
+# persisted under temp/ so repeat subjects survive restarts.
+GPT_MODEL_NAME = "gpt_4o_mini"
+GPT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "temp",
+    "gpt_cache",
+)
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[str, Any]" = OrderedDict()
+_disk_cache = None
+
+
+def _get_disk_cache():
+    """
+    Lazily open the on-disk GPT cache. Returns None if diskcache is unavailable.
+    """
+    global _disk_cache  # pylint: disable=global-statement
+    if _disk_cache is None and diskcache is not None:
+        try:
+            _disk_cache = diskcache.Cache(GPT_CACHE_DIR)
+        except OSError as e:
+            print(colored(f"[-] Could not open GPT cache: {e}", "yellow"))
+    return _disk_cache
+
+
+def _cache_key(*parts: str) -> str:
+    """
+    Build a stable cache key from the given prompt inputs.
+    """
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[Any]:
+    """
+    Return a cached GPT result, or None on a miss.
+    """
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        value = disk_cache.get(key)
+        if value is not None:
+            _cache_set(key, value, persist=False)
+            return value
+    return None
+
+
+def _cache_set(key: str, value: Any, persist: bool = True) -> None:
+    """
+    Store a GPT result in the memory cache and, optionally, on disk.
+    """
+    _memory_cache[key] = value
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > _MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    disk_cache = _get_disk_cache() if persist else None
+    if disk_cache is not None:
+        disk_cache.set(key, value)
+
+
 def generate_script(subject: str) -> str:
     """
     Generate a script for a video, depending on the subject of the video.
@@ -63,22 +157,15 @@ def generate_script(subject: str) -> str:
     ONLY RETURN THE RAW SCRIPT. DO NOT RETURN ANYTHING ELSE.
     """
 
+    cache_key = _cache_key(GPT_MODEL_NAME, "script", subject)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     # Generate script
     if g4f is None:
-        raise ImportError("The 'g4f' module is not installed."
-                          "Please install it to use this feature.")
-    if g4f is None:
-        raise ImportError("The 'g4f' module is not installed."
+        raise ImportError("The 'g4f' module is not installed. "
                           "Please install it to use this feature.")
-    if g4f is None:
-        raise ImportError("The 'g4f' module is not installed."
-                          "Please install it to use this feature.")
-    if g4f is None:
-        raise ImportError("The 'g4f' module is not installed or"
-                          "initialized. Please install it to use this feature.")
-    if g4f is None:
-        raise ImportError("The 'g4f' module is not installed or"
-                          "initialized. Please install and configure it.")
     response = g4f.ChatCompletion.create(
         model=g4f.models.gpt_4o_mini,  # Replace with the correct model name
         messages=[{"role": "user", "content": prompt}],
@@ -99,11 +186,15 @@ def generate_script(subject: str) -> str:
                 and isinstance(choice.get("message"), dict)
                 and "content" in choice.get("message", {})
             ):
-                return str(choice.get("message", {}).get("content", "")) + " "
+                script = str(choice.get("message", {}).get("content", "")) + " "
+                _cache_set(cache_key, script)
+                return script
             print(colored("[-] GPT returned an unexpected response format.", "red"))
             return str(response) + " "
         print(colored("[-] GPT returned an unexpected response format.", "red"))
-        return str(response) + " "
+        script = str(response) + " "
+        _cache_set(cache_key, script)
+        return script
     print(colored("[-] GPT returned an empty response.", "red"))
     return ""
 
@@ -147,6 +238,17 @@ def get_search_terms(subject: str, amount: int, video_script: str) -> List[str]:
     {video_script}
     """
 
+    cache_key = _cache_key(
+        GPT_MODEL_NAME,
+        "search_terms",
+        subject,
+        str(amount),
+        hashlib.sha1(video_script.encode("utf-8")).hexdigest(),
+    )
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return list(cached)
+
     # Generate search terms
     response = g4f.ChatCompletion.create(
         model=g4f.models.gpt_4o_mini,  # Ensure the model name is correct
@@ -157,7 +259,7 @@ def get_search_terms(subject: str, amount: int, video_script: str) -> List[str]:
 
     # Load response into JSON-Array
     try:
-        search_terms = json.loads(str(response))
+        search_terms = loads(str(response))
     except json.JSONDecodeError:
         print(
             colored(
@@ -166,19 +268,19 @@ def get_search_terms(subject: str, amount: int, video_script: str) -> List[str]:
             )
         )
 
-        # Use Regex to extract the array from the markdown
-        search_terms = re.findall(r"\[.*\]", str(response))
+        # Extract the first JSON array embedded in the markdown
+        search_terms = _extract_first_json_array(str(response))
 
         if not search_terms:
             print(colored("[-] Could not parse response.", "red"))
             return []
 
-        # Load the array into a JSON-Array
-        search_terms = json.loads(search_terms[0])
-
     # Let user know
     generated_terms = ", ".join(search_terms)
     print(colored(f"\nGenerated {amount} search terms: {generated_terms}", "cyan"))
 
+    if search_terms:
+        _cache_set(cache_key, list(search_terms))
+
     # Return search terms
     return search_terms
@@ -1,8 +1,78 @@
+import asyncio
 from typing import List
 
 import requests
 from termcolor import colored
 
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None
+
+PEXELS_SEARCH_URL = "https://api.pexels.com/videos/search"
+
+# Shared keep-alive session for the synchronous fallback path
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+)
+
+
+async def _search_one(session, tag: str) -> dict:
+    """
+    Query Pexels for a single tag and return the decoded JSON response.
+    """
+    params = {"query": tag, "per_page": 1}
+    async with session.get(PEXELS_SEARCH_URL, params=params) as r:
+        return await r.json(content_type=None)
+
+
+async def _search_all(tags: list, headers: dict) -> List[dict]:
+    """
+    Query Pexels for all tags concurrently over one pooled session.
+    """
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        results = await asyncio.gather(
+            *[_search_one(session, tag) for tag in tags], return_exceptions=True
+        )
+    responses = []
+    for tag, result in zip(tags, results):
+        if isinstance(result, Exception):
+            print(colored(f"[-] Pexels request failed for tag {tag}: {result}", "red"))
+            responses.append({})
+        else:
+            responses.append(result)
+    return responses
+
+
+def _search_all_sync(tags: list, headers: dict) -> List[dict]:
+    """
+    Query Pexels for all tags one after another over the shared session.
+    """
+    responses = []
+    for tag in tags:
+        params = {"query": tag, "per_page": 1}
+        r = _SESSION.get(PEXELS_SEARCH_URL, params=params, headers=headers, timeout=10)
+        responses.append(r.json())
+    return responses
+
+
+def _fetch_responses(tags: list, headers: dict) -> List[dict]:
+    """
+    Fetch the Pexels responses for all tags, concurrently when aiohttp is
+    available and no event loop is already running in this thread.
+    """
+    if aiohttp is None:
+        return _search_all_sync(tags, headers)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_search_all(tags, headers))
+    # Called from inside a running loop (e.g. an async route): asyncio.run
+    # is not allowed here, so fall back to the blocking path.
+    return _search_all_sync(tags, headers)
+
 
 def search_for_stock_videos(tags: list, api_key_value: str) -> List[str]:
     """
@@ -17,37 +87,26 @@ def search_for_stock_videos(tags: list, api_key_value: str) -> List[str]:
 
     video_links = []
 
-    for tag in tags:
-
-        # Build URL
-        url = f"https://api.pexels.com/videos/search?query={tag}&per_page=1"
-
-        # Send the request
-        r = requests.get(url, headers=headers, timeout=10)
-
-        # Parse the response
-        response = r.json()
+    for tag, response in zip(tags, _fetch_responses(tags, headers)):
 
         # Get first video url
         video_urls = []
-        video_url = ""
         try:
             video_urls = response["videos"][0]["video_files"]
             # print(video_urls)
-        except KeyError:
+        except (KeyError, IndexError):
             print(colored("[-] No Videos found.", "red"))
             print(colored(response, "red"))
 
-        # Loop through video urls
-        for video in video_urls:
-            # Check if video has a download link
-            if ".com/external" in video["link"]:
-                # Set video url
-                video_url = video["link"]
-                # print(
-                #     f"{video_url} | {video['quality']} | "
-                #     f"{video['width']}/{video['height']}"
-                # )
+        # Pick the last file that has a download link, stopping at the first hit
+        video_url = next(
+            (
+                video["link"]
+                for video in reversed(video_urls)
+                if ".com/external" in video["link"]
+            ),
+            "",
+        )
 
         # Let user know
         if video_url:
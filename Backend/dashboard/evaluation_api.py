@@ -2,20 +2,58 @@
 __summary__: Evaluation API for the codebase.
 __author__: Your Name
 """
+import json
 import logging
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 
-from Backend.dashboard.evaluation_logic import evaluate_codebase
+from Backend.dashboard.evaluation_logic import (
+    evaluate_codebase,
+    start_openai_key_validation,
+    stream_evaluate_codebase,
+)
 
 bp_evaluation = Blueprint("bp_evaluation", __name__)
 
+@bp_evaluation.record_once
+def _on_register(_state) -> None:
+    """Start the background OpenAI key check when the blueprint is registered."""
+    start_openai_key_validation()
+
+def _wants_stream() -> bool:
+    """
+    Return True if the client explicitly prefers NDJSON over plain JSON.
+    """
+    best = request.accept_mimetypes.best_match(["application/json", "application/x-ndjson"])
+    return best == "application/x-ndjson"
+
+def _stream_evaluation():
+    """
+    Yield evaluation events as newline-delimited JSON.
+    """
+    try:
+        for event in stream_evaluate_codebase():
+            yield json.dumps(event) + "\n"
+    except Exception as e:  # pylint: disable=broad-except
+        # The response has already started, so report the error in-band
+        logging.error("Unhandled exception during streamed evaluation: %s", str(e), exc_info=True)
+        yield json.dumps({
+            "prompt_recommendation": f"Error: {str(e)}",
+            "errors": [str(e)],
+            "done": True
+        }) + "\n"
+
 @bp_evaluation.route("/evaluation/", methods=["POST"])
 def run_evaluation():
     """
     API endpoint to run codebase evaluation and return prompt recommendation.
     Always returns a valid JSON response with prompt_recommendation and errors.
+    Clients sending 'Accept: application/x-ndjson' receive the recommendation
+    as a stream of {"chunk": ...} lines followed by a final "done" line.
     """
+    if _wants_stream():
+        return Response(stream_with_context(_stream_evaluation()),
+            mimetype="application/x-ndjson")
     try:
         result = evaluate_codebase()
         # Always return a valid JSON with prompt_recommendation
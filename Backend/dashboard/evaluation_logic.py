@@ -4,15 +4,26 @@ scanning logs for errors, and generating actionable next-step prompts.
 It is designed to be used in a Flask application context.
 """
 import os
+import atexit
+import copy
+import functools
 import json
+import mmap
 import re
 import logging
 import sys
+import threading
 import traceback
-from typing import Dict, List, Optional
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-logging.info("Python executable: %s", sys.executable)
-logging.info("sys.path: %s", sys.path)
+from Backend.utils import dumps, loads
+
+# Interpreter diagnostics are noisy under reloaders/multi-worker servers
+if os.environ.get("EVAL_DEBUG"):
+    logging.info("Python executable: %s", sys.executable)
+    logging.info("sys.path: %s", sys.path)
 
 # Only load .env locally (not in Docker)
 if os.path.exists('.env'):
@@ -24,6 +35,7 @@ if os.path.exists('.env'):
         logging.warning("python-dotenv not installed; skipping .env load.")
 
 try:
+    import httpx
     import openai
     # OpenAI v1.x: error classes are at the top level, e.g. openai.OpenAIError
 except ImportError as e:
@@ -31,26 +43,29 @@ except ImportError as e:
     logging.error(traceback.format_exc())
     openai = None  # Will raise error if used without install
 
-# Use config-driven, always-writable temp dir for log state
-TEMP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../temp'))
-LOG_STATE_FILE = os.path.join(TEMP_DIR, 'evaluation_log_state.json')
-
-def get_project_root() -> str:
+@functools.lru_cache(maxsize=1)
+def get_project_root() -> Path:
     """
     Returns the absolute path to the project root directory.
     """
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+    return Path(__file__).resolve().parent.parent.parent
 
+# Resolved once at import; Path objects keep their normalized string form
 PROJECT_ROOT = get_project_root()
-BACKEND_ROOT = os.path.join(PROJECT_ROOT, "Backend")
-PROGRESS_FILE = os.path.join(PROJECT_ROOT, "progress.json")
-README_FILE = os.path.join(PROJECT_ROOT, "READMEBUILD.md")
-REQUIREMENTS_FILE = os.path.join(PROJECT_ROOT, "Requirements.md")
-READMEBUILD_FILE = os.path.join(PROJECT_ROOT, "READMEBUILD.md")
+# Use config-driven, always-writable temp dir for log state
+TEMP_DIR = PROJECT_ROOT / "temp"
+LOG_STATE_FILE = TEMP_DIR / "evaluation_log_state.json"
+BACKEND_ROOT = PROJECT_ROOT / "Backend"
+PROGRESS_FILE = PROJECT_ROOT / "progress.json"
+README_FILE = PROJECT_ROOT / "READMEBUILD.md"
+REQUIREMENTS_FILE = PROJECT_ROOT / "Requirements.md"
+READMEBUILD_FILE = PROJECT_ROOT / "READMEBUILD.md"
 LOG_PATHS = [
-    os.path.join(BACKEND_ROOT, 'backend.log'),
-    os.path.join(PROJECT_ROOT, 'Dashboard/dashboard.log'),
+    BACKEND_ROOT / "backend.log",
+    PROJECT_ROOT / "Dashboard" / "dashboard.log",
 ]
+# Only this many leading characters of Requirements.md are sent to the AI agent
+PROMPT_README_CHARS = 2000
 RECOMMENDATION_TEMPLATE = (
     "## Prompt Recommendation\n\n"
     "{summary}\n\n"
@@ -58,6 +73,16 @@ RECOMMENDATION_TEMPLATE = (
     "**Rationale:** {rationale}\n\n"
     "{errors_section}"
 )
+# Precompiled patterns for parsing Requirements.md and READMEBUILD.md
+_REQ_STEP_RE = re.compile(r"^[ \t]*### 2\.\d+ Step \d+: (.+)$", re.MULTILINE)
+_RB_STATUS_RE = re.compile(
+    r"<!--STEP_(.+?)_START-->.*?<summary><b>(.+?) \((.+?)\)</b></summary>", re.DOTALL
+)
+_README_STEP_RE = re.compile(r"^[ \t]*#+ Step(?: \d+)?:? (.+)$", re.MULTILINE)
+# Case-insensitive keywords that mark a log line as an error/warning
+_ERROR_KEYWORDS_RE = re.compile(
+    rb"error|exception|traceback|permission denied|not found|failed", re.IGNORECASE
+)
 expected_steps = [
     "Ingest VOD",
     "Highlight Detection",
@@ -70,86 +95,127 @@ expected_steps = [
     "UI/Dashboard Integration",
 ]
 
-def parse_requirements_steps(requirements_path: str) -> List[str]:
+@functools.lru_cache(maxsize=8)
+def _read_head(
+    path: Union[str, Path], mtime: float, size: int, max_chars: Optional[int] = None
+) -> str:
+    """
+    Return the first max_chars characters of a file (or all of it) decoded as UTF-8.
+    mtime and size are only used as part of the cache key, so an edited
+    file is re-read while an unchanged one is served from memory.
+    """
+    if size == 0:
+        return ""
+    # A UTF-8 character is at most 4 bytes, so this prefix always holds max_chars
+    # whole characters; a sequence cut at its end is dropped, then sliced away
+    n = max_chars * 4 if max_chars is not None else None
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            data = mm[:n] if n is not None else mm[:]
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8", errors="ignore")
+    return text[:max_chars] if max_chars is not None else text
+
+def read_text_cached(path: Union[str, Path], max_chars: Optional[int] = None) -> str:
+    """
+    Read a text file (or its first max_chars characters) through the
+    (path, mtime, size) keyed cache.
+    Raises OSError if the file cannot be stat'ed or read.
+    """
+    st = os.stat(path)
+    return _read_head(path, st.st_mtime, st.st_size, max_chars)
+
+def _file_signature(path: Union[str, Path]) -> Optional[Tuple[float, int]]:
+    """Return (mtime, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+def parse_requirements_steps(requirements_path: Union[str, Path]) -> List[str]:
     """
     Parse Requirements.md to extract the canonical list of pipeline steps.
     Returns a list of step names in order.
     """
     steps = []
-    if not os.path.exists(requirements_path):
+    if not Path(requirements_path).exists():
         return steps
-    with open(requirements_path, encoding="utf-8") as f:
-        content = f.read()
+    content = read_text_cached(requirements_path)
     # Look for lines like '### 2.x Step N: Step Name' in the requirements
-    for line in content.splitlines():
-        m = re.match(r"### 2\\.\\d+ Step \\d+: (.+)", line.strip())
-        if m:
-            steps.append(m.group(1).strip())
-    return steps
+    return [m.group(1).strip() for m in _REQ_STEP_RE.finditer(content)]
 
-def parse_readmebuild_status(readmebuild_path: str) -> Dict[str, str]:
+def parse_readmebuild_status(readmebuild_path: Union[str, Path]) -> Dict[str, str]:
     """
     Parse READMEBUILD.md to determine which steps have been implemented and their status.
     Returns a dict mapping step names to status (e.g., 'completed', 'pending', 'failed').
     """
     status = {}
-    if not os.path.exists(readmebuild_path):
+    if not Path(readmebuild_path).exists():
         return status
-    with open(readmebuild_path, encoding="utf-8") as f:
-        content = f.read()
+    content = read_text_cached(readmebuild_path)
     # Look for foldable details blocks for each step
-    pattern = re.compile(
-        r"<!--STEP_(.+?)_START-->.*?<summary><b>(.+?) \\((.+?)\\)</b></summary>", re.DOTALL
-    )
-    for m in pattern.finditer(content):
+    for m in _RB_STATUS_RE.finditer(content):
         step_name = m.group(2)
         step_status = m.group(3).lower()
         status[step_name] = step_status
     return status
 
-def parse_readme_steps(readme_path: str) -> List[str]:
+def parse_readme_steps(readme_path: Union[str, Path]) -> List[str]:
     """Extract step names from the README markdown file."""
     steps = []
-    if not os.path.exists(readme_path):
+    if not Path(readme_path).exists():
         return steps
-    with open(readme_path, encoding="utf-8") as f:
-        content = f.read()
+    content = read_text_cached(readme_path)
     # Look for lines like '### Step 1: ...' or '### Step: ...'
-    for line in content.splitlines():
-        m = re.match(r"#+ Step(?: \d+)?:? (.+)", line.strip())
-        if m:
-            steps.append(m.group(1).strip())
-    return steps
+    return [m.group(1).strip() for m in _README_STEP_RE.finditer(content)]
 
-def scan_logs_for_errors(log_paths: List[str], max_lines: int = 200) -> List[str]:
+def scan_logs_for_errors(log_paths: List[Union[str, Path]], max_lines: int = 200, cap: int = 6) -> List[str]:
     """
     Scan only new lines of log files for error/warning messages since last evaluation.
     Log state is stored in /app/temp/evaluation_log_state.json for Docker compatibility.
+    At most `cap` errors are returned; callers show five, and the sixth only
+    signals that the list was truncated.
     """
     errors = []
     # Load last read positions
     try:
-        with open(LOG_STATE_FILE, 'r', encoding='utf-8') as f:
-            log_state = json.load(f)
+        with open(LOG_STATE_FILE, 'rb') as f:
+            raw_state = f.read()
+        log_state = loads(raw_state)
     except (FileNotFoundError, json.JSONDecodeError):
         log_state = {}
     new_log_state = {}
-    for log_path in log_paths:
-        if not os.path.exists(log_path):
+    for log_path in map(Path, log_paths):
+        # Log state is keyed by the string path so it round-trips through JSON
+        state_key = str(log_path)
+        try:
+            log_size = log_path.stat().st_size
+        except OSError:
+            continue
+        if len(errors) >= cap:
+            # Cap reached: advance the read position without scanning the file
+            new_log_state[state_key] = log_size
             continue
-        last_pos = log_state.get(log_path, 0)
-        with open(log_path, encoding="utf-8", errors="ignore") as f:
+        last_pos = log_state.get(state_key, 0)
+        with open(log_path, "rb") as f:
             f.seek(last_pos)
-            new_lines = f.readlines()
-            new_log_state[log_path] = f.tell()
-        for line in new_lines[-max_lines:]:
-            if any(w in line.lower() for w in ["error", "exception",
-                "traceback", "permission denied", "not found", "failed"]):
-                errors.append(line.strip())
-    # Save new positions
+            # Only the last max_lines new lines are kept in memory
+            new_lines = deque(f, maxlen=max_lines)
+            new_log_state[state_key] = f.tell()
+        for line in new_lines:
+            if _ERROR_KEYWORDS_RE.search(line):
+                errors.append(line.decode("utf-8", errors="ignore").strip())
+                if len(errors) >= cap:
+                    break
+    # Save new positions, skipping the write when no log has moved
+    if new_log_state == log_state:
+        return errors
     try:
-        with open(LOG_STATE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(new_log_state, f)
+        with open(LOG_STATE_FILE, 'wb') as f:
+            f.write(dumps(new_log_state))
     except (OSError, IOError, json.JSONDecodeError) as e:
         # Log the error for debugging, but do not interrupt flow
         logging.warning("Failed to save log state: %s", e)
@@ -196,21 +262,94 @@ def generate_next_step_prompt(
         errors_section=errors_section,
     )
 
-def generate_ai_prompt_recommendation(
+# Pooled OpenAI clients, keyed by API key
+_OPENAI_CLIENTS: Dict[str, "openai.OpenAI"] = {}
+_OPENAI_CLIENTS_LOCK = threading.Lock()
+
+def _openai_client(api_key: str) -> "openai.OpenAI":
+    """
+    Return a pooled OpenAI client for the given API key.
+    The client and its HTTP connection pool are reused across evaluations
+    so each request does not pay a fresh TCP/TLS handshake.
+    """
+    with _OPENAI_CLIENTS_LOCK:
+        client = _OPENAI_CLIENTS.get(api_key)
+        if client is None:
+            http_client = httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=300)
+            )
+            client = openai.OpenAI(api_key=api_key, http_client=http_client)
+            _OPENAI_CLIENTS[api_key] = client
+        return client
+
+@atexit.register
+def _close_openai_clients() -> None:
+    """Close pooled OpenAI clients on interpreter shutdown."""
+    with _OPENAI_CLIENTS_LOCK:
+        for client in _OPENAI_CLIENTS.values():
+            client.close()
+        _OPENAI_CLIENTS.clear()
+
+# Result of the last background key check, keyed by API key.
+# True = key works, False = auth/connection failed; missing = not checked yet.
+_OPENAI_KEY_STATUS: Dict[str, bool] = {}
+_OPENAI_KEY_RECHECK_SECONDS = float(os.environ.get("OPENAI_KEY_RECHECK_SECONDS", "600"))
+_openai_validation_started = False
+_openai_validation_lock = threading.Lock()
+
+def _validate_openai_key() -> None:
+    """
+    Check the configured OpenAI key with a cheap models.list() call and
+    record the outcome in _OPENAI_KEY_STATUS.
+    """
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if openai is None or not api_key:
+        return
+    try:
+        _openai_client(api_key).models.list()
+        _OPENAI_KEY_STATUS[api_key] = True
+        logging.info("OpenAI API key validated.")
+    except openai.AuthenticationError as exc:
+        _OPENAI_KEY_STATUS[api_key] = False
+        logging.error("OpenAI API key rejected: %s", exc)
+    except openai.APIConnectionError as exc:
+        _OPENAI_KEY_STATUS[api_key] = False
+        logging.error("OpenAI API unreachable during key check: %s", exc)
+    except openai.OpenAIError as exc:
+        # Rate limits and server errors say nothing about the key itself
+        logging.warning("OpenAI API key check inconclusive: %s", exc)
+
+def start_openai_key_validation() -> None:
+    """
+    Validate the OpenAI key in a background thread now and then every
+    OPENAI_KEY_RECHECK_SECONDS, so requests never wait on the check.
+    Safe to call more than once; only the first call starts the loop.
+    """
+    global _openai_validation_started  # pylint: disable=global-statement
+    with _openai_validation_lock:
+        if _openai_validation_started:
+            return
+        _openai_validation_started = True
+
+    def _run() -> None:
+        _validate_openai_key()
+        timer = threading.Timer(_OPENAI_KEY_RECHECK_SECONDS, _run)
+        timer.daemon = True
+        timer.start()
+
+    threading.Thread(target=_run, daemon=True).start()
+
+def openai_key_known_bad(api_key: Optional[str]) -> bool:
+    """Return True if the last background check found the key unusable."""
+    return _OPENAI_KEY_STATUS.get(api_key or "") is False
+
+def _build_ai_messages(
     readme_steps: List[str],
     progress: dict,
     errors: List[str],
     readme_content: str,
-    openai_api_key: str,
-    model: str = None
-) -> Optional[str]:
-    """
-    Use OpenAI (>=1.0.0) to generate a context-aware, actionable next-step prompt.
-    Returns the AI-generated prompt, or None if the API call fails.
-    """
-    if openai is None:
-        logging.error("openai package not installed. Cannot generate AI prompt.")
-        return None
+) -> List[Dict[str, str]]:
+    """Build the system/user chat messages for the AI prompt recommendation."""
     # Load agent mission from AGENT_PROMPT.md (hardcoded summary for performance)
     agent_mission = (
         "Build a fully-automated, self-learning content engine that continuously ingests Twitch streams and outputs viral, "
@@ -219,9 +358,6 @@ def generate_ai_prompt_recommendation(
         "Follow the agent protocol: always confirm the current step, summarize the goal, list options with pros/cons, recommend the best, and wait for user approval before coding. "
         "Document all changes in progress.json and READMEBUILD.md."
     )
-    # Use model from environment or default to GPT-4.1 (gpt-4.1-2025-04-14)
-    model_name = model or os.environ.get("OPENAI_MODEL", "gpt-4.1-2025-04-14")
-    logging.info("Using OpenAI model: %s", model_name)
     system_prompt = (
         f"You are an expert software project assistant for a Twitch-to-Shorts automation pipeline. "
         f"{agent_mission} "
@@ -230,44 +366,82 @@ def generate_ai_prompt_recommendation(
         "Be concise, specific, and always provide a clear, actionable next step."
     )
     user_prompt = (
-        f"README (truncated):\n{readme_content[:2000]}\n\n"
+        f"README (truncated):\n{readme_content}\n\n"
         f"Pipeline Steps: {readme_steps}\n"
         f"Progress: {progress}\n"
         f"Recent Errors: {errors[:5]}\n"
         f"Platform Requirements: YouTube Shorts (9:16, <60s), TikTok (emojis, fast cuts), Instagram Reels (polished transitions), Twitter (1:1 and 9:16 exports).\n"
     )
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+def stream_ai_prompt_recommendation(
+    readme_steps: List[str],
+    progress: dict,
+    errors: List[str],
+    readme_content: str,
+    openai_api_key: str,
+    model: str = None
+) -> Iterator[str]:
+    """
+    Use OpenAI (>=1.0.0) to stream a context-aware, actionable next-step prompt.
+    Yields content chunks as they arrive; yields nothing if the API call fails.
+    """
+    if openai is None:
+        logging.error("openai package not installed. Cannot generate AI prompt.")
+        return
+    # Use model from environment or default to GPT-4.1 (gpt-4.1-2025-04-14)
+    model_name = model or os.environ.get("OPENAI_MODEL", "gpt-4.1-2025-04-14")
+    logging.info("Using OpenAI model: %s", model_name)
+    messages = _build_ai_messages(readme_steps, progress, errors, readme_content)
     try:
-        client = openai.OpenAI(api_key=openai_api_key)
+        client = _openai_client(openai_api_key)
         response = client.chat.completions.create(
             model=model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+            messages=messages,
             temperature=0.3,
             max_tokens=300,
+            stream=True,
         )
-        logging.info("OpenAI API response: %s", response)
-        if response and response.choices:
-            # OpenAI v1.x: message is an object, not a dict
-            return response.choices[0].message.content
-        return None
+        for event in response:
+            if not event.choices:
+                continue
+            # OpenAI v1.x: delta is an object, not a dict
+            chunk = event.choices[0].delta.content or ""
+            if chunk:
+                yield chunk
     except openai.APIConnectionError as exc:
         logging.error("OpenAI API connection error: %s", exc)
-        return None
     except openai.AuthenticationError as exc:
         logging.error("OpenAI API authentication error: %s", exc)
-        return None
     except openai.OpenAIError as e:
         logging.error("OpenAI API error: %s", e)
-        return None
 
-def evaluate_codebase() -> Dict[str, str]:
+def generate_ai_prompt_recommendation(
+    readme_steps: List[str],
+    progress: dict,
+    errors: List[str],
+    readme_content: str,
+    openai_api_key: str,
+    model: str = None
+) -> Optional[str]:
     """
-    Evaluate the codebase against Requirements.md (source of truth for pipeline goals)
-    and READMEBUILD.md (summary/status of implemented steps). Always use the AI agent
-    (OpenAI) to generate the prompt recommendation, based on the current state and logs.
-    Returns a dict with 'prompt_recommendation' and 'errors'.
+    Use OpenAI (>=1.0.0) to generate a context-aware, actionable next-step prompt.
+    Returns the AI-generated prompt, or None if the API call fails.
+    """
+    content = "".join(stream_ai_prompt_recommendation(
+        readme_steps, progress, errors, readme_content, openai_api_key, model
+    ))
+    logging.info("OpenAI API response: %s", content)
+    return content or None
+
+def _prepare_evaluation() -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Gather the inputs for an evaluation run.
+    Returns (context, early_result); early_result is set when the AI agent
+    cannot be used and the evaluation should stop there.
     """
     # Parse canonical steps from Requirements.md
     canonical_steps = parse_requirements_steps(REQUIREMENTS_FILE)
@@ -277,43 +451,46 @@ def evaluate_codebase() -> Dict[str, str]:
     errors = scan_logs_for_errors(LOG_PATHS)
     # Prepare context for AI agent
     requirements_content = ""
-    if not os.path.exists(REQUIREMENTS_FILE):
+    if not REQUIREMENTS_FILE.exists():
         logging.error("Requirements.md is missing at %s. Please add"
                       " it to the project root.", REQUIREMENTS_FILE)
         errors.append(f"Requirements.md missing at {REQUIREMENTS_FILE}")
     else:
         try:
-            with open(REQUIREMENTS_FILE, "r", encoding="utf-8") as f:
-                requirements_content = f.read()
+            # Only the head of the file is sent to the AI agent, so read just that
+            requirements_content = read_text_cached(REQUIREMENTS_FILE, PROMPT_README_CHARS)
         except (OSError, IOError) as e:
             logging.error("Could not read Requirements.md due to file-related error: %s", e)
             errors.append(f"Could not read Requirements.md: {e}")
-        except json.JSONDecodeError as e:
-            logging.error("Could not read Requirements.md due to JSON decoding error: %s", e)
-            errors.append(f"Could not read Requirements.md (JSON error): {e}")
     openai_api_key = os.environ.get("OPENAI_API_KEY")
+    context = {
+        "canonical_steps": canonical_steps,
+        "implemented_status": implemented_status,
+        "errors": errors,
+        "requirements_content": requirements_content,
+        "openai_api_key": openai_api_key,
+    }
     if openai is None:
         logging.error("openai package is not installed. Please add"
                       " 'openai' to requirements.txt and install it.")
         errors.append("openai package not installed. Cannot generate AI prompt.")
-        return {"prompt_recommendation": "AI agent unavailable: openai"
+        return context, {"prompt_recommendation": "AI agent unavailable: openai"
                 "package not installed.", "errors": errors}
     if not openai_api_key:
         logging.error("OPENAI_API_KEY not set. Cannot generate AI prompt.")
         errors.append("OPENAI_API_KEY not set. Cannot generate AI prompt.")
-        return {"prompt_recommendation": "AI agent unavailable: missing API key.", "errors": errors}
-    ai_prompt = generate_ai_prompt_recommendation(
-        canonical_steps,
-        implemented_status,
-        errors,
-        requirements_content,
-        openai_api_key
-    )
+        return context, {"prompt_recommendation": "AI agent unavailable: missing API key.",
+            "errors": errors}
+    return context, None
+
+def _finalize_evaluation(context: Dict[str, Any], ai_prompt: Optional[str]) -> Dict[str, Any]:
+    """Apply the next-step fallback to the AI prompt and build the result dict."""
+    errors = context["errors"]
     # Fallback: if OpenAI fails, use next-step prompt logic
     if not ai_prompt:
         ai_prompt = generate_next_step_prompt(
-            canonical_steps,
-            implemented_status,
+            context["canonical_steps"],
+            context["implemented_status"],
             errors
         )
     if not ai_prompt:
@@ -321,3 +498,108 @@ def evaluate_codebase() -> Dict[str, str]:
         errors.append("AI agent failed to generate a prompt recommendation.")
         return {"prompt_recommendation": "AI agent failed to generate a prompt.", "errors": errors}
     return {"prompt_recommendation": ai_prompt, "errors": errors}
+
+# Recent evaluation results, keyed on the inputs that influence the AI prompt
+_EVAL_CACHE: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_EVAL_CACHE_SIZE = 16
+_EVAL_LOCK = threading.Lock()
+
+def _evaluation_cache_key(context: Dict[str, Any]) -> Tuple:
+    """
+    Build the cache key for an evaluation.
+    The log positions themselves move on every request (the app logs to the
+    scanned files), so the key uses the new error lines found instead.
+    """
+    return (
+        _file_signature(REQUIREMENTS_FILE),
+        _file_signature(READMEBUILD_FILE),
+        tuple(context["errors"]),
+        context["openai_api_key"],
+        os.environ.get("OPENAI_MODEL"),
+    )
+
+def _cache_evaluation(key: Tuple, result: Dict[str, Any]) -> None:
+    """Store an evaluation result in the bounded LRU cache."""
+    _EVAL_CACHE[key] = copy.deepcopy(result)
+    _EVAL_CACHE.move_to_end(key)
+    while len(_EVAL_CACHE) > _EVAL_CACHE_SIZE:
+        _EVAL_CACHE.popitem(last=False)
+
+def _cached_evaluation(key: Tuple) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached evaluation result, or None on a miss."""
+    result = _EVAL_CACHE.get(key)
+    if result is None:
+        return None
+    _EVAL_CACHE.move_to_end(key)
+    logging.info("Inputs unchanged since last evaluation; returning cached result.")
+    return copy.deepcopy(result)
+
+def evaluate_codebase() -> Dict[str, str]:
+    """
+    Evaluate the codebase against Requirements.md (source of truth for pipeline goals)
+    and READMEBUILD.md (summary/status of implemented steps). Always use the AI agent
+    (OpenAI) to generate the prompt recommendation, based on the current state and logs.
+    Repeat evaluations with unchanged inputs are served from an in-memory cache.
+    Returns a dict with 'prompt_recommendation' and 'errors'.
+    """
+    with _EVAL_LOCK:
+        context, result = _prepare_evaluation()
+        if result is not None:
+            return result
+        if openai_key_known_bad(context["openai_api_key"]):
+            # Skip the network call; the background check will retry the key
+            logging.warning("OpenAI key failed its last check; using next-step fallback.")
+            return _finalize_evaluation(context, None)
+        key = _evaluation_cache_key(context)
+        result = _cached_evaluation(key)
+        if result is not None:
+            return result
+        ai_prompt = generate_ai_prompt_recommendation(
+            context["canonical_steps"],
+            context["implemented_status"],
+            context["errors"],
+            context["requirements_content"],
+            context["openai_api_key"]
+        )
+        result = _finalize_evaluation(context, ai_prompt)
+        if ai_prompt:
+            # Only AI answers are cached; a fallback should be retried next time
+            _cache_evaluation(key, result)
+        return result
+
+def stream_evaluate_codebase() -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of evaluate_codebase.
+    Yields {'chunk': str} events as the AI recommendation is generated, then a
+    final event with 'prompt_recommendation', 'errors' and 'done': True.
+    The lock is only held while preparing and caching, never across a yield.
+    """
+    cached = False
+    with _EVAL_LOCK:
+        context, result = _prepare_evaluation()
+        if result is None and openai_key_known_bad(context["openai_api_key"]):
+            logging.warning("OpenAI key failed its last check; using next-step fallback.")
+            result = _finalize_evaluation(context, None)
+        if result is None:
+            key = _evaluation_cache_key(context)
+            result = _cached_evaluation(key)
+            cached = result is not None
+    if cached:
+        yield {"chunk": result["prompt_recommendation"]}
+    elif result is None:
+        chunks = []
+        for chunk in stream_ai_prompt_recommendation(
+            context["canonical_steps"],
+            context["implemented_status"],
+            context["errors"],
+            context["requirements_content"],
+            context["openai_api_key"]
+        ):
+            chunks.append(chunk)
+            yield {"chunk": chunk}
+        ai_prompt = "".join(chunks)
+        result = _finalize_evaluation(context, ai_prompt or None)
+        if ai_prompt:
+            with _EVAL_LOCK:
+                _cache_evaluation(key, result)
+    yield {**result, "done": True}
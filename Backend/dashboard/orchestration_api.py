@@ -1,22 +1,66 @@
 from flask import Blueprint, jsonify, request
 import logging
-from Backend.dashboard.orchestration_logic import run_evaluation_if_code_changed
+from concurrent.futures import Future
+from pathlib import Path
+from Backend.jobs import JobRegistry, job_status
+from Backend.dashboard.orchestration_logic import (
+    run_evaluation_if_code_changed,
+    validate_evaluation_target,
+)
 
 bp_orchestration = Blueprint('orchestration', __name__, url_prefix='/api/orchestration')
 
+# A single worker so two evaluations never run at the same time
+_jobs = JobRegistry('orchestration')
+
+
+def _log_job_failure(future: Future) -> None:
+    """
+    Log a failed background orchestration job.
+    """
+    error = future.exception()
+    if error is not None:
+        logging.error(f"Orchestration failed: {error}")
+
+
 @bp_orchestration.route('/', methods=['POST'])
 def run_orchestration():
     """
-    Run orchestration logic (e.g., evaluation if code changed).
+    Queue orchestration logic (e.g., evaluation if code changed) on a background worker.
+    Returns 202 with a job id that can be polled at /api/orchestration/<job_id>.
+    A request made while a job is still pending returns that job's id instead of queueing another.
     """
     try:
         # Example: expects JSON with code_dir, hash_file, evaluation_script
         data = request.get_json(force=True)
-        code_dir = data.get('code_dir')
-        hash_file = data.get('hash_file')
-        evaluation_script = data.get('evaluation_script')
-        run_evaluation_if_code_changed(code_dir, hash_file, evaluation_script)
-        return jsonify({'status': 'success'}), 200
+        code_dir = Path(data.get('code_dir'))
+        hash_file = Path(data.get('hash_file'))
+        # Either a script path or a "module:function" entry point
+        evaluation_script = str(data.get('evaluation_script'))
+        try:
+            validate_evaluation_target(evaluation_script)
+        except ValueError as e:
+            return jsonify({'status': 'error', 'message': str(e)}), 400
+        with _jobs.lock:
+            pending = _jobs.pending()
+            if pending is not None:
+                return jsonify(job_status(*pending)), 202
+            job_id, future = _jobs.submit(
+                run_evaluation_if_code_changed, code_dir, hash_file, evaluation_script
+            )
+        future.add_done_callback(_log_job_failure)
+        return jsonify({'status': 'queued', 'job_id': job_id}), 202
     except Exception as e:
         logging.error(f"Orchestration failed: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
+@bp_orchestration.route('/<int:job_id>', methods=['GET'])
+def orchestration_status(job_id: int):
+    """
+    Report the status of a queued orchestration job.
+    """
+    future = _jobs.get(job_id)
+    if future is None:
+        return jsonify({'status': 'error', 'message': f'Unknown job {job_id}'}), 404
+    return jsonify(job_status(job_id, future)), 200
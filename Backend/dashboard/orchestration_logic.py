@@ -1,51 +1,257 @@
 import hashlib
 import json
 import logging
+import os
+import re
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+from Backend.utils import dumps, loads
+
+try:
+    import xxhash  # type: ignore
+except ImportError:
+    xxhash = None
+
+try:
+    import msgpack  # type: ignore
+except ImportError:
+    msgpack = None
+
+# Change detection has no adversary, so prefer the much faster xxh3 when available.
+# The algorithm name is stored in the hash file so switching invalidates the cache.
+HASH_ALGO = 'xxh3_128' if xxhash is not None else 'sha256'
+# Read size for hashing individual files (xxh3 benefits from large blocks)
+HASH_CHUNK_SIZE = 1024 * 1024
+# Threads used to hash changed files concurrently
+HASH_WORKERS = min(32, os.cpu_count() or 4)
+
+
+def _new_hasher():
+    """
+    Return a new hasher for HASH_ALGO.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
+def _hash_file(path: Union[str, Path]) -> str:
+    """
+    Return the HASH_ALGO hex digest of a single file's contents.
+    """
+    hasher = _new_hasher()
+    with open(path, 'rb') as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+# Directories that never contain project sources; pruned from the walk entirely
+SKIP_DIRS = frozenset({
+    '__pycache__', '.git', '.venv', 'venv', 'node_modules', '.mypy_cache', '.pytest_cache',
+})
+
+
+def _iter_py_files(root: Path) -> Iterator[Tuple[str, str, os.stat_result]]:
+    """
+    Walk root with os.scandir, skipping SKIP_DIRS subtrees.
+    Yields (relative posix path, absolute path, stat) for each .py file.
+    """
+    stack = [(str(root), '')]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in SKIP_DIRS:
+                            stack.append((entry.path, prefix + name + '/'))
+                    elif name.endswith('.py') and entry.is_file():
+                        yield prefix + name, entry.path, entry.stat()
+        except OSError as e:
+            logging.warning("Could not scan %s: %s", directory, e)
+
+
+def hash_directory(
+    directory: Path,
+    cached_files: Dict[str, List[Any]]
+) -> Tuple[str, Dict[str, List[Any]]]:
+    """
+    Compute a digest over all .py files in a directory tree, ignoring SKIP_DIRS.
+    Files whose (mtime_ns, size) match their entry in cached_files reuse the
+    cached per-file digest instead of being re-read.
+    Args:
+        directory (Path): Directory to hash.
+        cached_files (Dict[str, List[Any]]): Map of relative path to
+            [mtime_ns, size, digest] from the previous run.
+    Returns:
+        Tuple[str, Dict[str, List[Any]]]: The directory digest and the
+        updated per-file map.
+    """
+    files: Dict[str, List[Any]] = {}
+    stale: Dict[str, str] = {}
+    for rel_path, file, st in sorted(_iter_py_files(directory), key=lambda e: e[0]):
+        cached = cached_files.get(rel_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            files[rel_path] = cached
+        else:
+            files[rel_path] = [st.st_mtime_ns, st.st_size, None]
+            stale[rel_path] = file
+    if stale:
+        # Reads and hash updates release the GIL, so changed files hash in parallel
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            digests = executor.map(_hash_file, stale.values())
+            for rel_path, digest in zip(stale, digests):
+                files[rel_path][2] = digest
+    # Fold per-file digests in sorted path order for a deterministic result
+    outer = _new_hasher()
+    for rel_path, (_, _, digest) in files.items():
+        outer.update(rel_path.encode('utf-8') + b'\0' + bytes.fromhex(digest))
+    return outer.hexdigest(), files
+
+
+# "package.module:function" entry points are run in-process instead of in a subprocess
+_ENTRY_POINT_RE = re.compile(r'^[A-Za-z_][\w.]*:[A-Za-z_]\w*$')
+
+
+def _evaluate_codebase() -> None:
+    """
+    Run the dashboard evaluation; imported on first use to keep this module light.
+    """
+    from Backend.dashboard.evaluation_logic import evaluate_codebase  # pylint: disable=import-outside-toplevel
+    evaluate_codebase()
+
+
+# The only entry points that may be run in-process. The spec can arrive in a
+# request body, so it is looked up here rather than imported by name.
+EVALUATION_ENTRY_POINTS: Dict[str, Callable[[], Any]] = {
+    'Backend.dashboard.evaluation_logic:evaluate_codebase': _evaluate_codebase,
+}
+
+
+def validate_evaluation_target(evaluation_script: Union[str, Path]) -> None:
+    """
+    Raise ValueError if evaluation_script is an entry point spec that is not
+    listed in EVALUATION_ENTRY_POINTS.
+    """
+    spec = str(evaluation_script)
+    if _ENTRY_POINT_RE.match(spec) and spec not in EVALUATION_ENTRY_POINTS:
+        raise ValueError(f"Unknown evaluation entry point: {spec}")
+
+
+def _run_evaluation(evaluation_script: Union[str, Path]) -> None:
+    """
+    Run the evaluation. An entry point from EVALUATION_ENTRY_POINTS, like
+    "Backend.dashboard.evaluation_logic:evaluate_codebase", is called in this
+    interpreter; anything else is treated as a script path and run with a
+    fresh interpreter.
+    """
+    validate_evaluation_target(evaluation_script)
+    spec = str(evaluation_script)
+    if spec in EVALUATION_ENTRY_POINTS:
+        EVALUATION_ENTRY_POINTS[spec]()
+        logging.info(f"Evaluation {spec} completed in-process")
+    else:
+        result = subprocess.run([sys.executable, spec], check=True)
+        logging.info(f"Evaluation completed with exit code {result.returncode}")
+
+
+def _decode_hash_state(raw: bytes) -> Any:
+    """
+    Decode hash state bytes. msgpack is tried first; files written as JSON by
+    older versions (or without msgpack installed) are still accepted.
+    """
+    if msgpack is not None:
+        try:
+            return msgpack.unpackb(raw, raw=False)
+        except (ValueError, msgpack.UnpackException):
+            pass
+    return loads(raw)
+
+
+def load_hash_state(hash_file: Path) -> Dict[str, Any]:
+    """
+    Load the {"algo": ..., "dir_hash": ..., "files": {...}} state from the hash file.
+    Returns an empty state if the file is missing or unreadable.
+    """
+    if not hash_file.exists():
+        return {}
+    try:
+        with open(hash_file, 'rb') as f:
+            raw = f.read()
+        state = _decode_hash_state(raw)
+        return state if isinstance(state, dict) else {}
+    except (OSError, json.JSONDecodeError) as e:
+        logging.warning("Could not read hash file: %s", e)
+        return {}
+
+
+def save_hash_state(hash_file: Path, state: Dict[str, Any]) -> None:
+    """
+    Persist the hash state to the hash file as a single msgpack record,
+    or as JSON when msgpack is not installed. The file is replaced atomically.
+    """
+    if msgpack is not None:
+        data = msgpack.packb(state)
+    else:
+        data = dumps(state)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=hash_file.parent, prefix=hash_file.name + '.')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, hash_file)
+    except OSError as e:
+        logging.warning("Could not write hash file: %s", e)
+
 
 def run_evaluation_if_code_changed(
     code_dir: Path,
     hash_file: Path,
-    evaluation_script: Path
+    evaluation_script: Union[str, Path]
 ) -> None:
     """
     Checks if the codebase has changed by comparing hashes. If changed, runs evaluation.py.
+    Only files whose mtime or size changed since the last run are re-read.
     Args:
         code_dir (Path): Directory to hash (e.g., project root).
-        hash_file (Path): File to store the last hash.
-        evaluation_script (Path): Path to evaluation.py script.
-    """
-    def hash_directory(directory: Path) -> str:
-        sha256 = hashlib.sha256()
-        for file in sorted(directory.rglob('*.py')):
-            with open(file, 'rb') as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-        return sha256.hexdigest()
+        hash_file (Path): File to store the last hash and per-file cache.
+        evaluation_script (Union[str, Path]): Path to evaluation.py script, or a
+            "module:function" entry point from EVALUATION_ENTRY_POINTS to call in-process.
+    """
+    code_dir, hash_file = Path(code_dir), Path(hash_file)
     logging.info(f"Checking for codebase changes in {code_dir}")
-    current_hash = hash_directory(code_dir)
-    last_hash: Optional[str] = None
-    if hash_file.exists():
-        try:
-            with open(hash_file, 'r') as f:
-                last_hash = json.load(f).get('hash')
-        except Exception as e:
-            logging.warning(f"Could not read hash file: {e}")
+    state = load_hash_state(hash_file)
+    if state.get('algo') != HASH_ALGO:
+        # Digests from another algorithm are not comparable
+        state = {}
+    last_hash = state.get('dir_hash')
+    cached_files = state.get('files') or {}
+    current_hash, files = hash_directory(code_dir, cached_files)
     if current_hash != last_hash:
         logging.info(f"Codebase changed. Running evaluation: {evaluation_script}")
         try:
-            result = subprocess.run([sys.executable, str(evaluation_script)], check=True)
-            logging.info(f"Evaluation completed with exit code {result.returncode}")
-            with open(hash_file, 'w') as f:
-                json.dump({'hash': current_hash}, f)
+            _run_evaluation(evaluation_script)
+            save_hash_state(hash_file, {'algo': HASH_ALGO, 'dir_hash': current_hash, 'files': files})
         except subprocess.CalledProcessError as e:
             logging.error(f"evaluation.py failed with exit code {e.returncode}")
+            # Keep the per-file cache but not the hash, so evaluation is retried
+            save_hash_state(hash_file, {'algo': HASH_ALGO, 'dir_hash': last_hash, 'files': files})
             raise
         except OSError as e:
             logging.error(f"Error running evaluation.py: {e}")
             raise
+        except Exception as e:
+            logging.error(f"Evaluation {evaluation_script} failed: {e}", exc_info=True)
+            save_hash_state(hash_file, {'algo': HASH_ALGO, 'dir_hash': last_hash, 'files': files})
+            raise
     else:
         logging.info("No codebase changes detected. Skipping evaluation.")
+        if files != cached_files:
+            # Files were touched without content changes; refresh their stats
+            save_hash_state(hash_file, {'algo': HASH_ALGO, 'dir_hash': current_hash, 'files': files})
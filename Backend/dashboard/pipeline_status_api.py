@@ -4,12 +4,18 @@ Aggregates video pipeline status for the dashboard Kanban view.
 """
 import json
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Set, Tuple
 
 from flask import Blueprint, jsonify
 
+from Backend.utils import loads
+
 bp_pipeline_status = Blueprint("bp_pipeline_status", __name__)
 
 # Config-driven paths for Windows/Docker compatibility
@@ -25,15 +31,34 @@ HIGHLIGHT_DIR = PROJECT_ROOT / "Backend" / "highlight_detection"
 VIDEO_EDITING_DIR = PROJECT_ROOT / "Backend" / "video_editing"
 UPLOADER_DIR = PROJECT_ROOT / "Backend" / "uploader"
 
+# Pipeline outputs written next to the source videos in TEMP_DIR
+DERIVED_VIDEO_PREFIXES = ("edited_", "published_")
+
+# Safe .mp4 filenames; \Z (unlike $) does not accept a trailing newline
+_VIDEO_FILENAME_RE = re.compile(r'^[\w\- .]+\.mp4\Z')
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a JSON file. Keyed on (path, mtime_ns, size) so a cached value is
+    only returned while the file is unchanged; parse errors are not cached.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    return loads(raw)
+
 # Helper to load JSON safely
 def load_json_safe(path: Path) -> Any:
     """
     Load JSON data from a file safely.
     description: Handles FileNotFoundError, JSONDecodeError, and OSError.
+    Parses with Backend.utils.loads (orjson's errors subclass JSONDecodeError).
+    Results are cached until the file's mtime or size changes, so callers
+    must treat the returned object as read-only.
     """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        st = os.stat(path)
+        return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
     except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
         logging.warning("Could not load %s: %s", path, e)
         return None
@@ -44,21 +69,81 @@ def is_valid_video_filename(filename: str) -> bool:
     Only allow alphanumeric, space, dash, underscore, and dot.
     """
     # Only allow .mp4 files with safe characters
-    return bool(re.match(r'^[\w\- .]+\.mp4$', filename))
+    return _VIDEO_FILENAME_RE.match(filename) is not None
+
+# Shared pool for overlapping the JSON file loads in _build_pipeline_status
+_io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pipeline_status")
+
+# Last computed pipeline status, keyed on the mtimes of its inputs
+_status_cache: Dict[str, Any] = {"key": None, "value": None}
+_status_cache_lock = threading.Lock()
+
+def _mtime_ns(path: Path) -> Tuple[int, int]:
+    """
+    Return (mtime_ns, size) for a path, or (0, 0) if it does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+def _pipeline_status_key() -> Tuple:
+    """
+    Build the cache key for get_pipeline_status.
+    Adding/removing videos, edited copies or published flags changes the
+    temp directory mtime; rating/highlight updates change the JSON files.
+    """
+    return (
+        _mtime_ns(TEMP_DIR),
+        _mtime_ns(HIGHLIGHT_DIR / "highlight.json"),
+        _mtime_ns(HIGHLIGHT_DIR / "highlight_ratings.json"),
+    )
 
 def get_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Aggregates the status of all videos in the pipeline, grouped by stage.
+    The result is reused until the temp directory or highlight JSON files change.
+    Returns a dict with keys: Ingested, Detection, Editing, Publishing.
+    """
+    with _status_cache_lock:
+        key = _pipeline_status_key()
+        if key == _status_cache["key"]:
+            return _status_cache["value"]
+        status = _build_pipeline_status()
+        _status_cache["key"] = key
+        _status_cache["value"] = status
+        return status
+
+def _list_temp_files() -> Set[str]:
+    """
+    Return the names of all regular files in TEMP_DIR using a single scandir pass.
+    Returns an empty set if the directory does not exist.
+    """
+    try:
+        with os.scandir(TEMP_DIR) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+def _build_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
     """
     Aggregates the status of all videos in the pipeline, grouped by stage.
     Returns a dict with keys: Ingested, Detection, Editing, Publishing.
     Only includes valid .mp4 files that exist in temp.
     """
     status: Dict[str, list] = {"Ingested": [], "Detection": [], "Editing": [], "Publishing": []}
-    # Build a set of all valid .mp4 filenames in temp
-    valid_video_files = {f.name for f in TEMP_DIR.glob("*.mp4")
-        if f.is_file() and is_valid_video_filename(f.name)}
-    logging.info("[pipeline_status] Found video files: %s", list(valid_video_files))
-    highlight_json = load_json_safe(HIGHLIGHT_DIR / "highlight.json") or {}
+    # One directory pass; edited/published lookups below are set membership tests
+    temp_files = _list_temp_files()
+    # Build a set of all valid source .mp4 filenames in temp. Edited and published
+    # copies live alongside them and must not be listed as ingested videos.
+    valid_video_files = {name for name in temp_files
+        if name.endswith(".mp4") and not name.startswith(DERIVED_VIDEO_PREFIXES)
+        and is_valid_video_filename(name)}
+    # Load both files concurrently; the ratings read runs on this thread
+    highlight_future = _io_pool.submit(load_json_safe, HIGHLIGHT_DIR / "highlight.json")
     ratings_json = load_json_safe(HIGHLIGHT_DIR / "highlight_ratings.json") or {}
+    highlight_json = highlight_future.result() or {}
     if not isinstance(highlight_json, dict):
         logging.warning("[pipeline_status] highlight.json is not a dict."
             " Got: %s. Treating as empty.", type(highlight_json))
@@ -67,8 +152,13 @@ def get_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
         logging.warning("[pipeline_status] highlight_ratings.json is not a dict. "
             "Got: %s. Treating as empty.", type(ratings_json))
         ratings_json = {}
-    logging.info("[pipeline_status] Loaded highlight_json keys: %s", list(highlight_json.keys()))
-    logging.info("[pipeline_status] Loaded ratings_json keys: %s", list(ratings_json.keys()))
+    # Building these lists is not free, so only do it when INFO is actually emitted
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("[pipeline_status] Found video files: %s", list(valid_video_files))
+        logging.info("[pipeline_status] Loaded highlight_json keys: %s", list(highlight_json))
+        logging.info("[pipeline_status] Loaded ratings_json keys: %s", list(ratings_json))
+    # Plain string prefix so the loop below does not build Path objects
+    temp_prefix = str(TEMP_DIR) + os.sep
     # Only process videos that actually exist in temp
     for video_name in valid_video_files:
         # If video is not in highlight.json, it's only ingested
@@ -77,32 +167,32 @@ def get_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
             continue
         highlights = highlight_json.get(video_name, [])
         rating = ratings_json.get(video_name, None)
-        detection_info = {
+        # One dict per video, extended in place as it moves through the stages
+        info = {
             "video": video_name,
             "highlights": highlights,
             "rating": rating,
             "approved": rating is not None,
         }
-        edited_path = TEMP_DIR / f"edited_{video_name}"
-        editing_info = {
-            "video": video_name,
-            "edited": edited_path.exists(),
-            "edited_path": str(edited_path) if edited_path.exists() else None,
-        }
-        published_flag = TEMP_DIR / f"published_{video_name}.flag"
-        publishing_info = {
-            "video": video_name,
-            "published": published_flag.exists(),
-            "output_location": str(published_flag) if published_flag.exists() else None,
-        }
-        if not detection_info["approved"]:
-            status["Detection"].append(detection_info)
-        elif not editing_info["edited"]:
-            status["Editing"].append({**detection_info, **editing_info})
-        else:
-            status["Publishing"].append({**detection_info, **editing_info, **publishing_info})
+        if not info["approved"]:
+            status["Detection"].append(info)
+            continue
+        edited_name = f"edited_{video_name}"
+        edited = edited_name in temp_files
+        info["edited"] = edited
+        info["edited_path"] = temp_prefix + edited_name if edited else None
+        if not edited:
+            status["Editing"].append(info)
+            continue
+        published_name = f"published_{video_name}.flag"
+        published = published_name in temp_files
+        info["published"] = published
+        info["output_location"] = temp_prefix + published_name if published else None
+        status["Publishing"].append(info)
     # Do not add placeholder entries for empty columns
-    logging.info("[pipeline_status] Final pipeline status: %s", status)
+    logging.info("[pipeline_status] Column sizes: ingested=%d detection=%d editing=%d publishing=%d",
+        len(status["Ingested"]), len(status["Detection"]),
+        len(status["Editing"]), len(status["Publishing"]))
     return status
 
 @bp_pipeline_status.route("/pipeline_status", methods=["GET"])
@@ -3,23 +3,31 @@ approval_app.py
 Web-based dashboard for reviewing, rating, and approving detected highlights.
 """
 import sys
+import asyncio
+import concurrent.futures
 import json
 import logging
-import subprocess
+import tempfile
 import threading
-from typing import Dict, List, Any
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import os
-from flask import Flask, flash, redirect, render_template, request, url_for, jsonify, abort
+from quart import (Quart, abort, flash, jsonify, make_response, redirect, render_template,
+    request, session, url_for)
 import markdown
+from Backend.utils import dumps, loads
 
 # Relative paths for highlights and ratings
 BASE_DIR = Path(__file__).parent.parent
 HIGHLIGHTS_PATH = BASE_DIR / 'highlight_detection' / 'highlights.json'
 RATINGS_PATH = BASE_DIR / 'highlight_detection' / 'highlight_ratings.json'
 VIDEO_DIR = BASE_DIR.parent / 'temp'
+EDITED_DIR = BASE_DIR / 'video_editing' / 'edited'
+PUBLISHED_DIR = BASE_DIR / 'uploader' / 'published'
 
-app = Flask(__name__)
+app = Quart(__name__)
 app.secret_key = 'supersecretkey'  # For flash messages
 
 # Configure logging with lazy formatting
@@ -32,20 +40,37 @@ logging.basicConfig(
     ]
 )
 
+# Parsed JSON files keyed by path; an entry is reused while (mtime_ns, size) is unchanged
+_json_cache: Dict[Path, Tuple[int, int, Any]] = {}
+
+def _cached_json(path: Path) -> Any:
+    """
+    Parse a JSON file, reusing the previous result while the file is unchanged.
+    Raises FileNotFoundError, OSError or json.JSONDecodeError like a plain load.
+    """
+    st = path.stat()
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    raw = path.read_bytes()
+    data = loads(raw)
+    _json_cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
 def load_highlights() -> List[Dict]:
     """
     Load highlights from highlights.json.
+    The parsed list is cached until the file changes and must not be mutated.
     """
     try:
-        if os.path.exists(HIGHLIGHTS_PATH):
-            with open(HIGHLIGHTS_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                logging.error("highlights.json is not a list. Returning empty list.")
-                return []
+        data = _cached_json(HIGHLIGHTS_PATH)
+        if isinstance(data, list):
+            return data
+        logging.error("highlights.json is not a list. Returning empty list.")
         return []
-    except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
+    except FileNotFoundError:
+        return []
+    except (json.JSONDecodeError, OSError) as e:
         logging.error("Error loading highlights.json: %s", e)
         return []
 
@@ -56,17 +81,17 @@ def load_ratings() -> Dict:
 
     Returns:
         Dict: A dictionary of highlight ratings with timestamps as keys.
+        A fresh copy is returned so callers may update it before save_ratings.
     """
     try:
-        if os.path.exists(RATINGS_PATH):
-            with open(RATINGS_PATH, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return data
-                logging.error("highlight_ratings.json is not a dict. Returning empty dict.")
-                return {}
+        data = _cached_json(RATINGS_PATH)
+        if isinstance(data, dict):
+            return dict(data)
+        logging.error("highlight_ratings.json is not a dict. Returning empty dict.")
+        return {}
+    except FileNotFoundError:
         return {}
-    except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
+    except (json.JSONDecodeError, OSError) as e:
         logging.error("Error loading highlight_ratings.json: %s", e)
         return {}
 
@@ -74,29 +99,57 @@ def load_ratings() -> Dict:
 def save_ratings(ratings: Dict):
     """
     Save highlight ratings to a JSON file.
+    Compact JSON is written to a temp file in the same directory and renamed over
+    the old file, so readers never see a partial write. /export/ratings serves
+    an indented copy for people.
     """
-    with open(RATINGS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(ratings, f, indent=2)
+    data = dumps(ratings)
+    fd, tmp_path = tempfile.mkstemp(dir=RATINGS_PATH.parent, prefix='.ratings.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, RATINGS_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     logging.info("Highlight ratings updated.")
 
+@app.route('/export/ratings')
+async def export_ratings():
+    """
+    Return highlight_ratings.json pretty-printed for reading or download.
+    """
+    body = json.dumps(load_ratings(), indent=2)
+    return app.response_class(body, mimetype='application/json')
+
 @app.route('/', methods=['GET', 'POST'])
-def approval_dashboard():
+async def approval_dashboard():
     """
     _summary_: Dashboard for reviewing and rating highlights.
     _return_: Rendered HTML template with highlights and ratings.
+    GETs carry a weak ETag over the two JSON files and get 304 while neither changed.
     """
+    etag = None
+    # A pending flash message must be rendered, so never answer 304 then
+    if request.method == 'GET' and '_flashes' not in session:
+        etag = _mtime_etag(HIGHLIGHTS_PATH, RATINGS_PATH)
+        if request.if_none_match.contains_weak(etag):
+            response = app.response_class('', status=304)
+            response.set_etag(etag, weak=True)
+            return response
     highlights = load_highlights()
     ratings = load_ratings()
     message = None
     if request.method == 'POST':
+        form = await request.form
         for h in highlights:
             ts = str(h['timestamp'])
-            rating = request.form.get(f'rating_{ts}')
-            approved = request.form.get(f'approve_{ts}') == 'on'
+            rating = form.get(f'rating_{ts}')
+            approved = form.get(f'approve_{ts}') == 'on'
             if rating:
                 ratings[ts] = {'rating': int(rating), 'approved': approved}
         save_ratings(ratings)
-        flash('Ratings and approvals saved!', 'success')
+        await flash('Ratings and approvals saved!', 'success')
         return redirect(url_for('approval_dashboard'))
     # If no highlights, show a message and display previously reviewed highlights if any
     if not highlights:
@@ -106,37 +159,117 @@ def approval_dashboard():
     for ts, data in ratings.items():
         reviewed.append({'timestamp': ts, 'rating': data.get('rating'),
             'approved': data.get('approved')})
-    return render_template('approval.html', highlights=highlights,
-        ratings=ratings, reviewed=reviewed, message=message, video_dir=VIDEO_DIR)
+    response = await make_response(await render_template('approval.html', highlights=highlights,
+        ratings=ratings, reviewed=reviewed, message=message, video_dir=VIDEO_DIR))
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'private, must-revalidate'
+    return response
+
+# A single event loop on a daemon thread awaits every pipeline script, so a
+# running script does not hold an OS thread of its own
+_script_loop = asyncio.new_event_loop()
+threading.Thread(target=_script_loop.run_forever, name='approval-scripts', daemon=True).start()
+
+# At most MAX_RUNNING_SCRIPTS children run at once; beyond MAX_PENDING_SCRIPTS
+# queued or running scripts, new requests are rejected
+MAX_RUNNING_SCRIPTS = 4
+MAX_PENDING_SCRIPTS = 16
+_script_slots = asyncio.Semaphore(MAX_RUNNING_SCRIPTS)
+_pending_scripts = 0
+_pending_lock = threading.Lock()
+
+async def _run_script(name: str, cmd: List[str]) -> None:
+    """Run a pipeline script as a subprocess on _script_loop. Logs output and errors."""
+    async with _script_slots:
+        logging.info("Running %s: %s", name, ' '.join(cmd))
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            stdout, stderr = await proc.communicate()
+        except OSError as e:
+            logging.error("Error running %s: %s", name, e)
+            return
+    out = stdout.decode('utf-8', errors='replace')
+    err = stderr.decode('utf-8', errors='replace')
+    if proc.returncode:
+        logging.error("%s failed: %s", name, err)
+        return
+    logging.info("%s output: %s", name, out)
+    if err:
+        logging.warning("%s stderr: %s", name, err)
+
+def _script_done(future: concurrent.futures.Future) -> None:
+    """Release a pending slot and log anything _run_script did not handle."""
+    global _pending_scripts  # pylint: disable=global-statement
+    with _pending_lock:
+        _pending_scripts -= 1
+    if not future.cancelled() and future.exception() is not None:
+        logging.error("Pipeline script crashed: %s", future.exception())
+
+def _submit_script(name: str, cmd: List[str]) -> Optional[concurrent.futures.Future]:
+    """
+    Schedule a pipeline script on the background loop and return its future,
+    or None if MAX_PENDING_SCRIPTS are already queued or running.
+    """
+    global _pending_scripts  # pylint: disable=global-statement
+    with _pending_lock:
+        if _pending_scripts >= MAX_PENDING_SCRIPTS:
+            logging.warning("Rejected %s: %d scripts already pending", name, _pending_scripts)
+            return None
+        _pending_scripts += 1
+    future = asyncio.run_coroutine_threadsafe(_run_script(name, cmd), _script_loop)
+    future.add_done_callback(_script_done)
+    return future
+
+def _too_busy():
+    """JSON 429 response for when the script queue is full."""
+    return jsonify({'status': 'error', 'message': 'Too many pipeline scripts pending.'}), 429
+
+def _evaluation_cmd() -> List[str]:
+    """Command line for running evaluation.py."""
+    eval_path = Path(__file__).parent.parent.parent / 'Dashboard' / 'evaluation.py'
+    return [sys.executable, str(eval_path)]
 
 @app.route('/run_evaluation', methods=['POST'])
-def run_evaluation():
+async def run_evaluation():
     """
-    API endpoint to trigger evaluation.py. Runs in a background thread.
+    API endpoint to trigger evaluation.py. Runs on the background script loop.
     Returns JSON status.
     """
-    def background_eval():
-        run_evaluation_script()
-    thread = threading.Thread(target=background_eval, daemon=True)
-    thread.start()
+    if _submit_script('evaluation.py', _evaluation_cmd()) is None:
+        return _too_busy()
     logging.info("Manual evaluation triggered via dashboard.")
     return jsonify({'status': 'started', 'message': 'Evaluation started.'}), 202
 
 def run_evaluation_script() -> None:
-    """Run evaluation.py as a background subprocess. Logs output and errors."""
-    eval_path = Path(__file__).parent.parent.parent / 'Dashboard' / 'evaluation.py'
-    try:
+    """Run evaluation.py as a subprocess and wait for it. Logs output and errors."""
+    future = _submit_script('evaluation.py', _evaluation_cmd())
+    if future is not None:
+        future.result()
 
-        cmd = [sys.executable, str(eval_path)]
-        logging.info("Running evaluation.py: %s", ' '.join(cmd))
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        logging.info("evaluation.py output: %s", result.stdout)
-        if result.stderr:
-            logging.warning("evaluation.py stderr: %s", result.stderr)
-    except subprocess.CalledProcessError as e:
-        logging.error("evaluation.py failed: %s", e.stderr)
-    except OSError as e:
-        logging.error("Error running evaluation.py: %s", e)
+# .mp4 listings keyed by directory; reused while the directory mtime is unchanged
+_listing_cache: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+
+def _list_mp4(directory: Path) -> Tuple[str, ...]:
+    """
+    Return the names of the .mp4 files in a directory with a single scandir pass.
+    The listing is cached until the directory's mtime changes.
+    Returns an empty tuple if the directory does not exist.
+    """
+    path = str(directory)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = _listing_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with os.scandir(path) as entries:
+            names = tuple(e.name for e in entries
+                if e.name.endswith('.mp4') and not e.name.startswith('.') and e.is_file())
+    except FileNotFoundError:
+        return ()
+    _listing_cache[path] = (mtime_ns, names)
+    return names
 
 def list_videos_for_step(step: str) -> List[str]:
     """
@@ -148,19 +281,19 @@ def list_videos_for_step(step: str) -> List[str]:
         return []
     # Filter videos based on the step (e.g., detection, editing, publishing)
     if step == 'detection':
-        return [str(f.name) for f in temp_dir.glob('*.mp4')]
+        return list(_list_mp4(temp_dir))
     elif step == 'editing':
         editing_dir = Path(__file__).parent.parent / 'video_editing' / 'edited'
-        return [str(f.name) for f in editing_dir.glob('*.mp4')] if editing_dir.exists() else []
+        return list(_list_mp4(editing_dir))
     elif step == 'publishing':
         publishing_dir = Path(__file__).parent.parent / 'uploader' / 'published'
-        return [f.name for f in publishing_dir.glob('*.mp4')] if publishing_dir.exists() else []
+        return list(_list_mp4(publishing_dir))
     else:
         logging.warning("Unknown step: %s", step)
         return []
 
 @app.route('/run_step/<step>', methods=['POST'])
-def run_step(step):
+async def run_step(step):
     """
     API endpoint to trigger a pipeline step script. 
     Supported steps: evaluation, detection, editing, publishing.
@@ -174,145 +307,139 @@ def run_step(step):
     script_path = script_map.get(step)
     if not script_path or not script_path.exists():
         return jsonify({'status': 'error', 'message': f'No script for step: {step}'}), 400
-    def background_run():
-        try:
-            cmd = [sys.executable, str(script_path)]
-            logging.info("Running %s script: %s", step, ' '.join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            logging.info("%s output: %s", step, result.stdout)
-            if result.stderr:
-                logging.warning("%s stderr: %s", step, result.stderr)
-        except subprocess.CalledProcessError as e:
-            logging.error("%s failed: %s", step, e.stderr)
-        except (OSError, subprocess.SubprocessError) as e:
-            logging.error("Error running %s: %s", step, e)
-    thread = threading.Thread(target=background_run, daemon=True)
-    thread.start()
+    if _submit_script(step, [sys.executable, str(script_path)]) is None:
+        return _too_busy()
     return jsonify({'status': 'started', 'message': f'{step.capitalize()} started.'}), 202
 
-def get_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
+async def get_pipeline_status() -> Dict[str, List[Dict[str, Any]]]:
     """
     Returns a dict with videos grouped by pipeline stage, each with expandable details.
     Stages: detection, editing, publishing. Each video is only in one stage at a time.
     """
-    temp_dir = Path(__file__).parent.parent.parent / 'temp'
-    highlights_path = Path(__file__).parent.parent / 'highlight_detection' / 'highlights.json'
-    ratings_path = Path(__file__).parent.parent / 'highlight_detection' / 'highlight_ratings.json'
-    editing_dir = Path(__file__).parent.parent / 'video_editing' / 'edited'
-    publishing_dir = Path(__file__).parent.parent / 'uploader' / 'published'
-
-    # Load highlight approvals
-    highlights = []
-    if highlights_path.exists():
-        try:
-            with open(highlights_path, 'r', encoding='utf-8') as f:
-                highlights = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
-            logging.error("Error loading highlights.json: %s", e)
-    ratings = {}
-    if ratings_path.exists():
-        try:
-            with open(ratings_path, 'r', encoding='utf-8') as f:
-                ratings = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
-            logging.error("Error loading highlight_ratings.json: %s", e)
+    # Load highlight approvals (cached until the files change); on a cache miss
+    # the two files are read and parsed concurrently off the event loop
+    highlights, ratings = await asyncio.gather(
+        asyncio.to_thread(load_highlights), asyncio.to_thread(load_ratings))
 
     # Gather all videos in temp
-    all_videos = list(temp_dir.glob('*.mp4')) if temp_dir.exists() else []
+    all_videos = _list_mp4(VIDEO_DIR)
     # Gather edited and published videos
-    edited_videos = list(editing_dir.glob('*.mp4')) if editing_dir.exists() else []
-    published_videos = list(publishing_dir.glob('*.mp4')) if publishing_dir.exists() else []
+    # File names only; name[:-4] is the stem since every entry ends in .mp4
+    edited_videos = _list_mp4(EDITED_DIR)
+    published_videos = _list_mp4(PUBLISHED_DIR)
 
-    # Helper: get highlights for a video
-    def get_highlights_for_video(video_name: str) -> List[Dict[str, Any]]:
-        return [h for h in highlights if h.get('video') == video_name]
+    # Index highlights by video once instead of scanning them for every video
+    highlights_by_video: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for h in highlights:
+        highlights_by_video[h.get('video')].append(h)
+    # Index edited files (named <video stem>_<timestamp>.mp4) as {video stem: {timestamp: file}}
+    edited_by_video: Dict[str, Dict[str, str]] = defaultdict(dict)
+    for e in edited_videos:
+        video_stem, _, ts = e[:-4].rpartition('_')
+        edited_by_video[video_stem].setdefault(ts, e)
 
-    # Helper: get highlight approval status
-    def highlight_approved(ts: str) -> bool:
-        return ratings.get(str(ts), {}).get('approved', False)
+    # Normalise ratings once: the set of approved timestamps and each timestamp's rating
+    approved_ts = set()
+    rating_by_ts: Dict[str, Any] = {}
+    for ts, data in ratings.items():
+        if isinstance(data, dict):
+            rating_by_ts[ts] = data.get('rating')
+            if data.get('approved'):
+                approved_ts.add(ts)
 
     # Build pipeline status
     status = {'detection': [], 'editing': [], 'publishing': []}
-    for v in all_videos:
-        video_name = v.name
-        video_highlights = get_highlights_for_video(video_name)
+    for video_name in all_videos:
+        video_highlights = highlights_by_video.get(video_name, [])
         if not video_highlights:
             # No highlights yet, still in detection
             status['detection'].append({'video': video_name, 'highlights': []})
             continue
+        keys = [str(h['timestamp']) for h in video_highlights]
         # Check if all highlights are approved/rejected
-        all_reviewed = all(str(h['timestamp']) in ratings for h in video_highlights)
-        all_approved = all(highlight_approved(h['timestamp']) for h in video_highlights)
-        if not all_reviewed:
-            # Still in detection until all highlights reviewed
-            status['detection'].append({
-                'video': video_name,
-                'highlights': [
-                    {
-                        'timestamp': h['timestamp'],
-                        'approved': highlight_approved(h['timestamp']),
-                        'rating': ratings.get(str(h['timestamp']), {}).get('rating')
-                    } for h in video_highlights
-                ]
-            })
-        elif all_approved:
+        all_reviewed = all(ts in ratings for ts in keys)
+        all_approved = all(ts in approved_ts for ts in keys)
+        if all_reviewed and all_approved:
             # If all highlights approved, move to editing
             # Find edited highlights for this video
-            edited = [e for e in edited_videos if e.stem.startswith(video_name.replace('.mp4', ''))]
+            edited = edited_by_video.get(video_name[:-4], {})
             status['editing'].append({
                 'video': video_name,
                 'highlights': [
                     {
                         'timestamp': h['timestamp'],
                         'approved': True,
-                        'edited': any(e.stem.endswith(str(h['timestamp'])) for e in edited),
+                        'edited': ts in edited,
                         'planogram': None,  # Placeholder for planogram info
-                        'edited_video': next((str(e.name) for e in edited 
-                            if e.stem.endswith(str(h['timestamp']))), None)
-                    } for h in video_highlights if highlight_approved(h['timestamp'])
+                        'edited_video': edited.get(ts)
+                    } for h, ts in zip(video_highlights, keys)
                 ]
             })
         else:
-            # If any highlight rejected, do not proceed to editing
+            # Still in detection until all highlights are reviewed, and stays
+            # there if any highlight was rejected
             status['detection'].append({
                 'video': video_name,
                 'highlights': [
                     {
                         'timestamp': h['timestamp'],
-                        'approved': highlight_approved(h['timestamp']),
-                        'rating': ratings.get(str(h['timestamp']), {}).get('rating')
-                    } for h in video_highlights
+                        'approved': ts in approved_ts,
+                        'rating': rating_by_ts.get(ts)
+                    } for h, ts in zip(video_highlights, keys)
                 ]
             })
     # Now, check for videos in publishing (all highlights edited)
+    # Sorted published names: any name starting with a prefix sorts at or right after it
+    published_sorted = sorted(published_videos)
     for v in edited_videos:
-        video_name = v.name.split('_')[0] + '.mp4'
+        video_name = v.split('_')[0] + '.mp4'
         # Assumes edited files are named like original_highlight.mp4
         # If published, move to publishing
-        published = any(p.name.startswith(v.stem) for p in published_videos)
+        idx = bisect_left(published_sorted, v[:-4])
+        published = idx < len(published_sorted) and published_sorted[idx].startswith(v[:-4])
         if published:
             status['publishing'].append({
                 'video': video_name,
-                'edited_video': v.name,
+                'edited_video': v,
                 'published': True
             })
         else:  # already shown in editing
             status['editing'].append({
                 'video': video_name,
-                'edited_video': v.name,
+                'edited_video': v,
                 'published': False
             })
     return status
 
 @app.route('/pipeline_status')
-def pipeline_status():
+async def pipeline_status():
     """
     Returns videos grouped by pipeline stage, with expandable details for highlights and edits.
+    Sends a weak ETag so polling clients get 304 Not Modified while nothing changed.
+    """
+    # Everything get_pipeline_status reads
+    etag = _mtime_etag(VIDEO_DIR, EDITED_DIR, PUBLISHED_DIR, HIGHLIGHTS_PATH, RATINGS_PATH)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class('', status=304)
+    else:
+        response = jsonify(await get_pipeline_status())
+    response.set_etag(etag, weak=True)
+    return response
+
+def _mtime_etag(*paths: Path) -> str:
+    """
+    Build an ETag from the mtimes of the given paths. Missing paths contribute 0.
     """
-    return jsonify(get_pipeline_status())
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(0)
+    return f'{hash(tuple(signature)) & 0xFFFFFFFFFFFFFFFF:x}'
 
 @app.route('/docs')
-def list_docs():
+async def list_docs():
     """
     List all .md files in the repo for documentation viewing.
     """
@@ -320,28 +447,49 @@ def list_docs():
     md_files = list(repo_root.glob('*.md'))
     return jsonify([f.name for f in md_files])
 
+# Rendered HTML per markdown file, reused while the file's mtime is unchanged
+_md_cache: Dict[Path, Tuple[int, str]] = {}
+
+def _render_markdown(file_path: Path) -> str:
+    """Render a markdown file to HTML."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        md_content = f.read()
+    return markdown.markdown(md_content, extensions=['fenced_code', 'tables'])
+
 @app.route('/docs/<filename>')
-def get_doc(filename):
+async def get_doc(filename):
     """Serve the contents of a .md file as HTML (rendered markdown)."""
     repo_root = Path(__file__).parent.parent.parent
     file_path = repo_root / filename
     if not file_path.exists() or not file_path.suffix == '.md':
         abort(404)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-        html = markdown.markdown(md_content, extensions=['fenced_code', 'tables'])
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = _md_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            html = cached[1]
+        else:
+            # Rendering is pure-Python and slow, so keep it off the event loop
+            html = await asyncio.to_thread(_render_markdown, file_path)
+            _md_cache[file_path] = (mtime_ns, html)
         return jsonify({'html': html, 'filename': filename})
     except (FileNotFoundError, OSError, IOError) as e:
         logging.error("Error reading markdown file %s: %s", filename, e)
         abort(500)
 
 @app.errorhandler(Exception)
-def handle_exception(e):
+async def handle_exception(e):
     """Handle unhandled exceptions and log the error."""
     logging.error("Unhandled exception: %s", e)
-    return render_template('approval.html', highlights=[], ratings={},
+    return await render_template('approval.html', highlights=[], ratings={},
         reviewed=[], message="An error occurred. Please check the logs.", video_dir=VIDEO_DIR), 500
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5001, host='0.0.0.0')
+    try:
+        import uvicorn  # type: ignore
+    except ImportError:
+        # Quart's built-in development server
+        app.run(debug=True, port=5001, host='0.0.0.0')
+    else:
+        # Uses uvloop automatically when it is installed
+        uvicorn.run(app, host='0.0.0.0', port=5001, workers=1)
@@ -4,7 +4,7 @@ Module for detecting highlights in Twitch VODs using chat activity spikes and au
 
 Approach:
 - Fetch chat logs and VODs automatically (using Twitch API or Streamlink/VodBot).
-- Analyze chat logs for message rate and emote bursts (pandas/numpy).
+- Analyze chat logs for message rate and emote bursts (numpy).
 - Analyze audio for peaks (FFmpeg, via subprocess, for robust detection).
 - Output highlights.json with highlight timestamps.
 
@@ -12,61 +12,83 @@ Future enhancements, limitations, and references are documented in highlight_det
 """
 
 import json
+import re
 import subprocess
 from typing import List, Dict
 import logging
-import pandas as pd
+import numpy as np
+from Backend.utils import dumps, loads
 
 # --- Chat Analysis ---
-def load_chat_log(chat_log_path: str) -> pd.DataFrame:
-    """Load chat log JSON into a DataFrame."""
-    with open(chat_log_path, 'r', encoding='utf-8') as f:
-        chat_data = json.load(f)
+def load_chat_log(chat_log_path: str) -> np.ndarray:
+    """Load the epoch-second timestamps of all chat messages from a chat log JSON."""
+    with open(chat_log_path, 'rb') as f:
+        raw = f.read()
+    chat_data = loads(raw)
     # Expecting chat_data as a list of dicts with 'timestamp' and 'message' keys
-    df = pd.DataFrame(chat_data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-    return df
+    return np.fromiter(
+        (m['timestamp'] for m in chat_data if m.get('message') is not None),
+        dtype=np.float64,
+    )
 
-def detect_chat_spikes(df: pd.DataFrame, window_sec: int = 10, threshold: int = 10) -> List[int]:
+def detect_chat_spikes(timestamps: np.ndarray, window_sec: int = 10, threshold: int = 10) -> List[int]:
     """Detect time windows with chat spikes."""
-    df = df.set_index('timestamp')
-    counts = df['message'].resample(f'{window_sec}S').count()
-    spikes = counts[counts > threshold]
-    return [int(ts.timestamp()) for ts in spikes.index]
+    if timestamps.size == 0:
+        return []
+    # Bucket on epoch-aligned windows (as resample did) and count with bincount
+    buckets = (timestamps // window_sec).astype(np.int64)
+    first = buckets.min()
+    buckets -= first  # in place; no extra temporary for large logs
+    counts = np.bincount(buckets)
+    spike_idx = np.flatnonzero(counts > threshold)
+    return ((spike_idx + first) * window_sec).tolist()
 
 # --- Audio Analysis ---
+# FFmpeg logs silence_end: <time> | silence_duration: <dur>
+# Matched against raw stderr bytes so lines are never decoded
+_SILENCE_END_RE = re.compile(rb'silence_end:\s*([\d.]+)')
+
 def detect_audio_peaks_ffmpeg(video_path: str, silence_thresh: float = -30.0,
     min_duration: float = 0.5) -> List[int]:
     """Detect audio peaks using FFmpeg's silencedetect (returns start times of loud segments)."""
+    # Only the first audio stream is read (-vn/-sn/-dn skip everything else) and it is
+    # downmixed to 16 kHz mono inside the filter chain, ahead of silencedetect, which
+    # is plenty for a loudness gate; -nostats drops the progress lines
     cmd = [
-        'ffmpeg', '-i', video_path, '-af',
+        'ffmpeg', '-hide_banner', '-nostats', '-i', video_path,
+        '-map', '0:a:0', '-vn', '-sn', '-dn', '-af',
+        'aformat=sample_rates=16000:channel_layouts=mono,'
         f'silencedetect=noise={silence_thresh}dB:d={min_duration}',
         '-f', 'null', '-'
     ]
-    result = subprocess.run(cmd, stderr=subprocess.PIPE,
-        stdout=subprocess.PIPE, text=True, check=True)
-    lines = result.stderr.split('\n')
     peaks = []
-    for line in lines:
-        if 'silence_end:' in line:
-            # FFmpeg logs silence_end: <time> | silence_duration: <dur>
-            try:
-                time_str = line.split('silence_end:')[1].split('|')[0].strip()
-                peaks.append(int(float(time_str)))
-            except (ValueError, IndexError):
-                continue
+    # Parse stderr as ffmpeg writes it instead of buffering the whole log
+    with subprocess.Popen(cmd, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+        bufsize=-1) as proc:
+        for line in proc.stderr:
+            match = _SILENCE_END_RE.search(line)
+            if match:
+                try:
+                    peaks.append(int(float(match.group(1))))
+                except ValueError:
+                    continue
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
     return peaks
 
 # --- Highlight Detection ---
 def find_highlights(chat_spikes: List[int], audio_peaks: List[int], window: int = 10) -> List[Dict]:
     """Find highlight timestamps where chat and audio spikes overlap within a window (seconds)."""
-    highlights = []
-    for chat_time in chat_spikes:
-        for audio_time in audio_peaks:
-            if abs(chat_time - audio_time) <= window:
-                highlights.append({'timestamp': chat_time})
-                break
-    return highlights
+    if not chat_spikes or not audio_peaks:
+        return []
+    peaks = np.sort(np.asarray(audio_peaks, dtype=np.int64))
+    chats = np.asarray(chat_spikes, dtype=np.int64)
+    # Compare each chat spike with its nearest audio peak on either side
+    idx = np.searchsorted(peaks, chats)
+    after = peaks[np.minimum(idx, len(peaks) - 1)]
+    before = peaks[np.maximum(idx - 1, 0)]
+    mask = (np.abs(after - chats) <= window) | (np.abs(chats - before) <= window)
+    return [{'timestamp': int(t)} for t in chats[mask]]
 
 # --- Main Pipeline ---
 def detect_highlights(video_path: str, chat_log_path: str, output_path: str = 'highlights.json'):
@@ -89,12 +111,12 @@ def detect_highlights(video_path: str, chat_log_path: str, output_path: str = 'h
         ValueError: If the input data is invalid or improperly formatted.
     """
     try:
-        chat_df = load_chat_log(chat_log_path)
-        chat_spikes = detect_chat_spikes(chat_df)
+        chat_timestamps = load_chat_log(chat_log_path)
+        chat_spikes = detect_chat_spikes(chat_timestamps)
         audio_peaks = detect_audio_peaks_ffmpeg(video_path)
         highlights = find_highlights(chat_spikes, audio_peaks)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(highlights, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(dumps(highlights, indent=True))
         print(f"Highlights written to {output_path}")
         return highlights
     except (FileNotFoundError, ValueError, json.JSONDecodeError) as e:
@@ -2,27 +2,39 @@
 """
 Audio analysis for highlight detection: detects audio peaks using FFmpeg.
 """
+import re
 import subprocess
 from typing import List
 import logging
 
+# FFmpeg logs silence_end: <time> | silence_duration: <dur>
+# Matched against raw stderr bytes so lines are never decoded
+_SILENCE_END_RE = re.compile(rb'silence_end:\s*([\d.]+)')
+
 def detect_audio_peaks_ffmpeg(video_path: str, silence_thresh: float = -30.0, min_duration: float = 0.5) -> List[int]:
     """Detect audio peaks using FFmpeg's silencedetect (returns start times of loud segments)."""
+    # Only the first audio stream is read (-vn/-sn/-dn skip everything else) and it is
+    # downmixed to 16 kHz mono inside the filter chain, ahead of silencedetect, which
+    # is plenty for a loudness gate; -nostats drops the progress lines
     cmd = [
-        'ffmpeg', '-i', video_path, '-af',
+        'ffmpeg', '-hide_banner', '-nostats', '-i', video_path,
+        '-map', '0:a:0', '-vn', '-sn', '-dn', '-af',
+        'aformat=sample_rates=16000:channel_layouts=mono,'
         f'silencedetect=noise={silence_thresh}dB:d={min_duration}',
         '-f', 'null', '-'
     ]
-    result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
-    lines = result.stderr.split('\n')
     peaks = []
-    for line in lines:
-        if 'silence_end:' in line:
-            try:
-                time_str = line.split('silence_end:')[1].split('|')[0].strip()
-                peaks.append(int(float(time_str)))
-            except Exception as e:
-                logging.error(f"Error parsing silence_end line: {line} | {e}")
-                continue
+    # Parse stderr as ffmpeg writes it instead of buffering the whole log
+    with subprocess.Popen(cmd, stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                          bufsize=-1) as proc:
+        for line in proc.stderr:
+            match = _SILENCE_END_RE.search(line)
+            if match:
+                try:
+                    peaks.append(int(float(match.group(1))))
+                except ValueError as e:
+                    logging.error(f"Error parsing silence_end line: {line.decode(errors='replace')} | {e}")
+    if proc.returncode:
+        logging.warning(f"ffmpeg exited with code {proc.returncode} for {video_path}")
     logging.info(f"Detected {len(peaks)} audio peaks in {video_path}")
     return peaks
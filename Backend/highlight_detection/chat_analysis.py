@@ -2,24 +2,33 @@
 """
 Chat analysis for highlight detection: detects chat spikes and emote bursts.
 """
-import pandas as pd
+import numpy as np
 from typing import List
 import logging
+from Backend.utils import loads
 
-def load_chat_log(chat_log_path: str) -> pd.DataFrame:
-    """Load chat log JSON into a DataFrame."""
-    import json
-    with open(chat_log_path, 'r', encoding='utf-8') as f:
-        chat_data = json.load(f)
-    df = pd.DataFrame(chat_data)
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-    logging.info(f"Loaded chat log with {len(df)} messages from {chat_log_path}")
-    return df
+def load_chat_log(chat_log_path: str) -> np.ndarray:
+    """Load the epoch-second timestamps of all chat messages from a chat log JSON."""
+    with open(chat_log_path, 'rb') as f:
+        raw = f.read()
+    chat_data = loads(raw)
+    timestamps = np.fromiter(
+        (m['timestamp'] for m in chat_data if m.get('message') is not None),
+        dtype=np.float64,
+    )
+    logging.info(f"Loaded chat log with {len(timestamps)} messages from {chat_log_path}")
+    return timestamps
 
-def detect_chat_spikes(df: pd.DataFrame, window_sec: int = 10, threshold: int = 10) -> List[int]:
+def detect_chat_spikes(timestamps: np.ndarray, window_sec: int = 10, threshold: int = 10) -> List[int]:
     """Detect time windows with chat spikes."""
-    df = df.set_index('timestamp')
-    counts = df['message'].resample(f'{window_sec}S').count()
-    spikes = counts[counts > threshold]
-    logging.info(f"Detected {len(spikes)} chat spikes.")
-    return [int(ts.timestamp()) for ts in spikes.index]
+    if timestamps.size == 0:
+        logging.info("Detected 0 chat spikes.")
+        return []
+    # Bucket on epoch-aligned windows (as resample did) and count with bincount
+    buckets = (timestamps // window_sec).astype(np.int64)
+    first = buckets.min()
+    buckets -= first  # in place; no extra temporary for large logs
+    counts = np.bincount(buckets)
+    spike_idx = np.flatnonzero(counts > threshold)
+    logging.info(f"Detected {len(spike_idx)} chat spikes.")
+    return ((spike_idx + first) * window_sec).tolist()
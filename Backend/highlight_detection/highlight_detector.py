@@ -7,8 +7,10 @@ import os
 import json
 import logging
 from typing import List, Dict
+import numpy as np
 from .chat_analysis import load_chat_log, detect_chat_spikes
 from .audio_analysis import detect_audio_peaks_ffmpeg
+from Backend.utils import dumps, loads
 
 HIGHLIGHT_RATINGS_PATH = os.path.join(os.path.dirname(__file__), 'highlight_ratings.json')
 
@@ -36,25 +38,41 @@ logging.basicConfig(
     ]
 )
 
+def _match_spikes(chat_spikes: List[int], audio_peaks: List[int], window: int) -> List[Dict]:
+    """
+    Return a highlight for each chat spike that has an audio peak within window seconds.
+    """
+    if not chat_spikes or not audio_peaks:
+        return []
+    peaks = np.sort(np.asarray(audio_peaks, dtype=np.int64))
+    chats = np.asarray(chat_spikes, dtype=np.int64)
+    # Compare each chat spike with its nearest audio peak on either side
+    idx = np.searchsorted(peaks, chats)
+    after = peaks[np.minimum(idx, len(peaks) - 1)]
+    before = peaks[np.maximum(idx - 1, 0)]
+    mask = (np.abs(after - chats) <= window) | (np.abs(chats - before) <= window)
+    return [{'timestamp': int(t)} for t in chats[mask]]
+
 def find_highlights(chat_spikes: List[int], audio_peaks: List[int], window: int = 10) -> List[Dict]:
     """
     Find highlight timestamps where chat and audio spikes overlap within a window (seconds).
     """
-    highlights = []
-    for chat_time in chat_spikes:
-        for audio_time in audio_peaks:
-            if abs(chat_time - audio_time) <= window:
-                highlights.append({'timestamp': chat_time})
-                break
+    highlights = _match_spikes(chat_spikes, audio_peaks, window)
     logging.info("Matched %d highlights (chat+audio overlap)", len(highlights))
     return highlights
 
+def _write_json(path: str, data) -> None:
+    """
+    Write data as indented JSON, using orjson when it is installed.
+    """
+    with open(path, 'wb') as f:
+        f.write(dumps(data, indent=True))
+
 def save_highlights_json(highlights: List[Dict], output_path: str):
     """
     Save highlights to a JSON file.
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(highlights, f, indent=2)
+    _write_json(output_path, highlights)
     logging.info("Highlights written to %s", output_path)
 
 def load_ratings() -> Dict:
@@ -62,8 +80,9 @@ def load_ratings() -> Dict:
     Load highlight ratings from a JSON file.
     """
     if os.path.exists(HIGHLIGHT_RATINGS_PATH):
-        with open(HIGHLIGHT_RATINGS_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(HIGHLIGHT_RATINGS_PATH, 'rb') as f:
+            raw = f.read()
+        return loads(raw)
     return {}
 
 def save_ratings(ratings: Dict):
@@ -74,8 +93,7 @@ def save_ratings(ratings: Dict):
         ratings (Dict): A dictionary of highlight ratings where 
         keys are timestamps and values are ratings.
     """
-    with open(HIGHLIGHT_RATINGS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(ratings, f, indent=2)
+    _write_json(HIGHLIGHT_RATINGS_PATH, ratings)
     logging.info("Highlight ratings updated in %s", HIGHLIGHT_RATINGS_PATH)
 
 def rate_highlights(highlights: List[Dict]):
@@ -126,8 +144,8 @@ def detect_highlights(video_path: str, chat_log_path: str, output_path: str = 'h
         json.JSONDecodeError: If the chat log file contains invalid JSON.
     """
     try:
-        chat_df = load_chat_log(chat_log_path)
-        chat_spikes = detect_chat_spikes(chat_df)
+        chat_timestamps = load_chat_log(chat_log_path)
+        chat_spikes = detect_chat_spikes(chat_timestamps)
         audio_peaks = detect_audio_peaks_ffmpeg(video_path)
         highlights = find_highlights(chat_spikes, audio_peaks)
         save_highlights_json(highlights, output_path)
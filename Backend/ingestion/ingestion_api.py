@@ -1,14 +1,48 @@
 from flask import Blueprint, jsonify, request
 import logging
 import os
-from Backend.ingestion.vod_ingestion import ingest_vods
+from concurrent.futures import Future
+from Backend.jobs import JobRegistry, job_status
 
 bp_ingestion = Blueprint('ingestion', __name__, url_prefix='/api/ingest')
 
+# One ingestion at a time; concurrent runs would download into the same temp dir
+_jobs = JobRegistry('ingestion')
+
+
+def _job_status(job_id: int, future: Future):
+    """
+    Describe a queued ingestion job as a (JSON body, status code) pair.
+    """
+    if not future.done():
+        return job_status(job_id, future), 200
+    e = future.exception()
+    if e is None:
+        return {'job_id': job_id, 'status': 'success', 'video_paths': future.result()}, 200
+    if isinstance(e, ValueError):
+        logging.error(f"Value error during ingestion: {e}")
+        return {'job_id': job_id, 'status': 'error', 'message': 'Invalid input provided.'}, 400
+    if isinstance(e, KeyError):
+        logging.error(f"Missing key during ingestion: {e}")
+        return {'job_id': job_id, 'status': 'error', 'message': f'Missing required key: {e}'}, 400
+    logging.error(f"Unexpected error during ingestion: {e}")
+    return {'job_id': job_id, 'status': 'error', 'message': 'An unexpected error occurred.'}, 500
+
+
+def _run_ingest(*args, **kwargs):
+    """
+    Run ingest_vods on the worker thread. vod_ingestion pulls in yt_dlp, moviepy
+    and the LLM client, so it is imported on first use rather than at startup.
+    """
+    from Backend.ingestion.vod_ingestion import ingest_vods
+    return ingest_vods(*args, **kwargs)
+
+
 @bp_ingestion.route('/', methods=['POST'])
 def run_ingestion():
     """
-    Trigger the Twitch VOD ingestion pipeline. Returns the list of ingested video paths as JSON.
+    Queue the Twitch VOD ingestion pipeline on a background worker.
+    Returns 202 with a job id; GET /api/ingest/<job_id> reports the ingested video paths when done.
     Expects environment variables or JSON body for credentials.
     """
     try:
@@ -21,20 +55,27 @@ def run_ingestion():
         temp_dir = data.get('temp_dir', 'temp')
         if not (twitch_client_id and twitch_access_token and twitch_channel_id):
             return jsonify({'status': 'error', 'message': 'Missing Twitch credentials.'}), 400
-        video_paths = ingest_vods(
+        job_id, _ = _jobs.submit(
+            _run_ingest,
             twitch_client_id,
             twitch_access_token,
             twitch_channel_id,
             pexels_api_key=pexels_api_key,
             temp_dir=temp_dir
         )
-        return jsonify({'status': 'success', 'video_paths': video_paths}), 200
-    except ValueError as e:
-        logging.error(f"Value error during ingestion: {e}")
-        return jsonify({'status': 'error', 'message': 'Invalid input provided.'}), 400
-    except KeyError as e:
-        logging.error(f"Missing key during ingestion: {e}")
-        return jsonify({'status': 'error', 'message': f'Missing required key: {e}'}), 400
+        return jsonify({'status': 'started', 'job_id': job_id}), 202
     except Exception as e:
         logging.error(f"Unexpected error during ingestion: {e}")
         return jsonify({'status': 'error', 'message': 'An unexpected error occurred.'}), 500
+
+
+@bp_ingestion.route('/<int:job_id>', methods=['GET'])
+def ingestion_status(job_id: int):
+    """
+    Report the status of a queued ingestion job.
+    """
+    future = _jobs.get(job_id)
+    if future is None:
+        return jsonify({'status': 'error', 'message': f'Unknown job {job_id}'}), 404
+    body, code = _job_status(job_id, future)
+    return jsonify(body), code
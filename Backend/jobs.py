@@ -0,0 +1,81 @@
+"""
+Background job registry shared by the blueprints that queue long-running work.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Jobs kept around for status polling; only finished jobs are ever dropped
+MAX_TRACKED_JOBS = 32
+
+
+def job_status(job_id: int, future: Future) -> Dict[str, Any]:
+    """
+    Describe a job for the JSON API: queued, running, success or error.
+    """
+    if future.running():
+        return {'job_id': job_id, 'status': 'running'}
+    if not future.done():
+        return {'job_id': job_id, 'status': 'queued'}
+    error = future.exception()
+    if error is not None:
+        return {'job_id': job_id, 'status': 'error', 'message': str(error)}
+    return {'job_id': job_id, 'status': 'success'}
+
+
+class JobRegistry:
+    """
+    A single-worker executor plus the futures it returned, keyed on an
+    increasing job id. Hold `lock` to make a check and a submit atomic.
+    """
+
+    def __init__(self, name: str, max_tracked: int = MAX_TRACKED_JOBS):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._jobs: "OrderedDict[int, Future]" = OrderedDict()
+        self._ids = itertools.count(1)
+        self.max_tracked = max_tracked
+        self.lock = threading.RLock()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[int, Future]:
+        """
+        Queue fn(*args, **kwargs) and return its job id and future.
+        """
+        with self.lock:
+            future = self._executor.submit(fn, *args, **kwargs)
+            job_id = next(self._ids)
+            self._jobs[job_id] = future
+            self._evict_finished()
+            return job_id, future
+
+    def get(self, job_id: int) -> Optional[Future]:
+        """
+        Return the future of a tracked job, or None if unknown or evicted.
+        """
+        with self.lock:
+            return self._jobs.get(job_id)
+
+    def pending(self) -> Optional[Tuple[int, Future]]:
+        """
+        Return the newest job that is still queued or running, if any.
+        """
+        with self.lock:
+            for job_id in reversed(self._jobs):
+                future = self._jobs[job_id]
+                if not future.done():
+                    return job_id, future
+            return None
+
+    def _evict_finished(self) -> None:
+        """
+        Drop the oldest finished jobs beyond max_tracked. Queued and running
+        jobs are kept so their ids can still be polled.
+        """
+        excess = len(self._jobs) - self.max_tracked
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, future in self._jobs.items() if future.done()]
+        for job_id in finished[:excess]:
+            del self._jobs[job_id]
@@ -7,65 +7,87 @@ search for stock videos, and produce final video outputs with subtitles and
 audio.
 """
 
-import hashlib
 import logging
 import os
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import List  # Ensure List is imported for type hints
+from typing import List, Optional, Tuple  # Ensure List is imported for type hints
+from urllib.parse import quote
 
 from flask import Blueprint, Flask, abort, jsonify, send_from_directory, Response
 
+# Resolved once here; everything below derives its paths from these
+BACKEND_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = BACKEND_DIR.parent
+
 # Ensure the project root is in sys.path for absolute imports
-PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 # Ensure the Backend directory is in sys.path for imports
-BACKEND_DIR = Path(__file__).parent
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
+# Only Flask and the blueprints are imported here; the video, ML and LLM modules
+# are imported by the code paths that use them, to keep startup fast.
 try:
     from dotenv import load_dotenv
-    from moviepy.audio.io.AudioFileClip import AudioFileClip
 
-    from Backend.content.gpt import generate_script, get_search_terms
-    from Backend.content.search import search_for_stock_videos
     from Backend.dashboard.evaluation_api import bp_evaluation
     from Backend.dashboard.orchestration_api import bp_orchestration
-    from Backend.dashboard.pipeline_status_api import bp_pipeline_status
-    from Backend.highlight_detection.highlight_detector import \
-        detect_highlights
+    from Backend.dashboard.orchestration_logic import (
+        HASH_ALGO,
+        hash_directory,
+        load_hash_state,
+        save_hash_state,
+    )
+    from Backend.dashboard.pipeline_status_api import (
+        bp_pipeline_status,
+        is_valid_video_filename,
+    )
     from Backend.ingestion.ingestion_api import bp_ingestion
-    from Backend.video_editing.editor import combine_videos
-    import openai  # Only import openai, do not import error submodule
 except ModuleNotFoundError as e:
     logging.error("Import failed: %s. Please ensure all"
         "dependencies are installed and requirements.txt is up to date.", e)
     # Exit with code 3 to indicate a fatal import error (Compose will only restart twice)
     sys.exit(3)
-except ImportError as e:
-    logging.error("ImportError for openai: %s", e, exc_info=True)
-    openai = None
-
-# Set up unified backend logging to Backend/backend.log
-LOG_DIR = os.path.join(os.path.dirname(__file__), 'backend.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_DIR, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+
+try:
+    from waitress import serve  # type: ignore
+except ImportError:
+    serve = None
+
+# Set up unified backend logging to Backend/backend.log. basicConfig ignores
+# handlers once the root logger has some, so skip opening the log file again
+# when this module is imported a second time (e.g. as __main__ and Backend.main).
+LOG_DIR = str(BACKEND_DIR / 'backend.log')
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[
+            logging.FileHandler(LOG_DIR, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
 
 HASH_FILE = BACKEND_DIR / '.codebase_hash'
+# Per-file [mtime_ns, size, digest] cache so unchanged files are not re-read
+HASH_CACHE_FILE = BACKEND_DIR / '.codebase_hash_cache'
 EVAL_SCRIPT = BACKEND_DIR / 'dashboard' / 'evaluation_logic.py'
 DASHBOARD_SCRIPT = BACKEND_DIR / 'highlight_approval' / 'approval_app.py'
 
 bp_temp = Blueprint('temp', __name__)
+TEMP_DIR = str(PROJECT_ROOT / 'temp')
+# Cached (mtime_ns, names) of the markdown files in the project root
+_markdown_listing: Optional[Tuple[int, List[str]]] = None
+# When a reverse proxy serves temp/ from an internal location (e.g. nginx
+# "location /internal_temp/ { internal; alias /app/temp/; }"), set this to that
+# location's prefix and the proxy streams the file instead of Python.
+TEMP_ACCEL_REDIRECT_PREFIX = os.environ.get('TEMP_ACCEL_REDIRECT_PREFIX', '')
 
 def get_temp_dir() -> str:
     """
@@ -73,18 +95,7 @@ def get_temp_dir() -> str:
     Uses only relative/config-driven paths for Windows and Docker compatibility.
     Always resolves to the project root's temp directory (e.g., /app/temp in Docker).
     """
-    # Use pathlib for robust, cross-platform path resolution
-    project_root = Path(__file__).resolve().parent.parent
-    temp_dir = project_root / 'temp'
-    return str(temp_dir)
-
-def is_valid_video_filename(filename: str) -> bool:
-    """
-    Validate that the filename is a valid .mp4 file and does not contain suspicious characters.
-    Only allow alphanumeric, space, dash, underscore, and dot.
-    """
-    import re
-    return bool(re.match(r'^[\w\- .]+\.mp4$', filename))
+    return TEMP_DIR
 
 @bp_temp.route('/temp/<path:filename>')
 def serve_temp_file(filename: str):
@@ -103,40 +114,30 @@ def serve_temp_file(filename: str):
     if not os.path.isfile(file_path):
         logging.warning("Requested video file not found: %s", file_path)
         abort(404, description=f"Video file not found: {filename}")
+    if TEMP_ACCEL_REDIRECT_PREFIX:
+        logging.info("Handing video file to proxy: %s", file_path)
+        response = Response(mimetype='video/mp4')
+        response.headers['X-Accel-Redirect'] = TEMP_ACCEL_REDIRECT_PREFIX.rstrip('/') + '/' + quote(filename)
+        return response
     logging.info("Serving video file: %s", file_path)
-    return send_from_directory(temp_dir, filename)
-
-
-def get_py_files(directory: Path) -> List[Path]:
-    """
-    Recursively get all .py files in the directory, excluding __pycache__ and venv.
-    """
-    py_files = []
-    for root, dirs, files in os.walk(directory):
-        dirs[:] = [d for d in dirs if d not in ('__pycache__', 'venv')]
-        # Ensure brackets are properly closed
-        for file in files:
-            if file.endswith('.py'):
-                py_files.append(Path(root) / file)
-    return py_files
+    # conditional=True answers If-None-Match/If-Modified-Since with 304 and Range with 206
+    return send_from_directory(temp_dir, filename, conditional=True, etag=True)
 
 
-def compute_hash(files: List[Path]) -> str:
+def compute_codebase_hash() -> str:
     """
-    Compute a SHA256 hash of the contents of the given files.
+    Hash the Backend sources with the incremental hasher shared with the
+    orchestration API. Per-file digests are kept in HASH_CACHE_FILE, so only
+    files whose mtime or size changed are re-read.
+    Returns the hash as "<algo>:<hexdigest>", so switching algorithms is seen
+    as a change.
     """
-    hasher = hashlib.sha256()
-    for file in sorted(files):
-        try:
-            with open(file, 'rb') as f:
-                while True:
-                    chunk = f.read(8192)
-                    if not chunk:
-                        break
-                    hasher.update(chunk)
-        except OSError as e:
-            logging.error("Failed to read %s: %s", file, e)
-    return hasher.hexdigest()
+    state = load_hash_state(HASH_CACHE_FILE)
+    cached_files = (state.get('files') or {}) if state.get('algo') == HASH_ALGO else {}
+    digest, files = hash_directory(BACKEND_DIR, cached_files)
+    if files != cached_files:
+        save_hash_state(HASH_CACHE_FILE, {'algo': HASH_ALGO, 'files': files})
+    return f"{HASH_ALGO}:{digest}"
 
 
 def read_last_hash() -> str:
@@ -158,13 +159,18 @@ def read_last_hash() -> str:
 def write_hash(hash_value: str) -> None:
     """
     Write the provided hash value to the HASH_FILE.
+    Does nothing if the file already holds it; otherwise the file is replaced atomically.
 
     Args:
         hash_value (str): The hash string to write.
     """
+    if hash_value == read_last_hash():
+        return
     try:
-        with open(HASH_FILE, 'w', encoding='utf-8') as f:
+        fd, tmp_path = tempfile.mkstemp(dir=HASH_FILE.parent, prefix='.codebase_hash.')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
             f.write(hash_value)
+        os.replace(tmp_path, HASH_FILE)
     except OSError as e:
         logging.error("Could not write hash file: %s", e)
 
@@ -172,27 +178,59 @@ def write_hash(hash_value: str) -> None:
 def run_script(script_path: Path) -> int:
     """
     Run a Python script using the current interpreter. Returns exit code.
+    The script's stdout and stderr are logged line by line as they arrive.
     """
     cmd = [sys.executable, str(script_path)]
     logging.info("Running script: %s", ' '.join(cmd))
     try:
-        result = subprocess.run(cmd, check=True)
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        logging.error("Script %s failed with exit code %s", script_path, e.returncode)
-        return e.returncode
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, errors='replace'
+        ) as proc:
+            for line in proc.stdout:
+                logging.info("[%s] %s", script_path.stem, line.rstrip())
+            exit_code = proc.wait()
+        if exit_code != 0:
+            logging.error("Script %s failed with exit code %s", script_path, exit_code)
+        return exit_code
     except OSError as e:
         logging.error("Unexpected error running %s: %s", script_path, e)
         return 1
 
 
+def start_script(script_path: Path) -> Optional[subprocess.Popen]:
+    """
+    Start a Python script with the current interpreter without waiting for it.
+    Returns the process, or None if it could not be started.
+    """
+    cmd = [sys.executable, str(script_path)]
+    logging.info("Starting script: %s", ' '.join(cmd))
+    try:
+        return subprocess.Popen(cmd)
+    except OSError as e:
+        logging.error("Unexpected error running %s: %s", script_path, e)
+        return None
+
+
+def _wait_and_write_hash(proc: subprocess.Popen, hash_value: str) -> None:
+    """
+    Wait for the evaluation process and record hash_value if it succeeded.
+    """
+    exit_code = proc.wait()
+    if exit_code == 0:
+        logging.info("Evaluation logic finished. Updating hash.")
+        write_hash(hash_value)
+    else:
+        logging.error("evaluation logic failed with exit code %s. Not updating hash.", exit_code)
+
+
 def load_env_vars(dotenv_path: str = ".env") -> None:
     """
     Load environment variables from a .env file using python-dotenv.
     Args:
         dotenv_path (str): Path to the .env file (relative).
     """
-    env_path = Path(__file__).parent.parent / dotenv_path
+    env_path = PROJECT_ROOT / dotenv_path
     if env_path.exists():
         load_dotenv(dotenv_path=str(env_path))
         logging.info("Loaded environment variables from %s", env_path)
@@ -212,6 +250,25 @@ def create_app():
     app.register_blueprint(bp_pipeline_status, url_prefix="/api")
     app.register_blueprint(bp_temp)
     
+    @app.route('/api/eval_status')
+    def eval_status() -> Response:
+        """
+        Report the state of the startup evaluation run.
+        Returns:
+            flask.Response: JSON with status (idle, running, succeeded or failed)
+            and the exit code once finished.
+        """
+        proc = app.config.get('eval_proc')
+        if proc is None:
+            return jsonify({'status': 'idle'})
+        exit_code = proc.poll()
+        if exit_code is None:
+            return jsonify({'status': 'running'})
+        return jsonify({
+            'status': 'succeeded' if exit_code == 0 else 'failed',
+            'exit_code': exit_code,
+        })
+
     @app.route('/api/markdown_files')
     def list_markdown_files() -> 'flask.Response':
         """
@@ -219,10 +276,15 @@ def create_app():
         Returns:
             flask.Response: JSON list of markdown filenames.
         """
+        global _markdown_listing  # pylint: disable=global-statement
+        project_root = PROJECT_ROOT
         try:
-            # Use pathlib for robust, cross-platform path resolution
-            project_root = Path(__file__).resolve().parent.parent
+            # Adding, removing or renaming a file changes the directory mtime
+            mtime_ns = os.stat(project_root).st_mtime_ns
+            if _markdown_listing is not None and _markdown_listing[0] == mtime_ns:
+                return jsonify(_markdown_listing[1])
             md_files = [f.name for f in project_root.glob('*.md') if f.name.lower() != 'env.md']
+            _markdown_listing = (mtime_ns, md_files)
             logging.info("Markdown files found in %s: %s", project_root, md_files)
             return jsonify(md_files)
         except (OSError, UnicodeDecodeError) as e:
@@ -235,7 +297,7 @@ def create_app():
         Serve the content of a markdown file from the project root.
         Only allows .md files that exist in the project root.
         """
-        project_root = Path(__file__).resolve().parent.parent
+        project_root = PROJECT_ROOT
         # Security: Only allow .md files, no path traversal
         if not filename.endswith('.md') or '/' in filename or '\\' in filename:
             logging.warning("Rejected markdown file request: %s", filename)
@@ -256,6 +318,18 @@ def create_app():
     return app
 
 
+def use_dev_server() -> bool:
+    """
+    Return True if the Flask development server (debugger and reloader) should be used.
+    That is the case when FLASK_DEBUG or FLASK_ENV=development asks for it, or when
+    waitress is not installed.
+    """
+    if serve is None:
+        return True
+    return (os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+            or os.environ.get('FLASK_ENV') == 'development')
+
+
 def main():
     """
     Entrypoint for the application. 
@@ -266,16 +340,24 @@ def main():
     logging.info("App started. Checking for Backend code changes...")
     logging.info("Python executable: %s", sys.executable)
     logging.info("sys.path: %s", sys.path)
-    py_files = get_py_files(BACKEND_DIR)
-    current_hash = compute_hash(py_files)
+    current_hash = compute_codebase_hash()
+    app = create_app()
     last_hash = read_last_hash()
-    if current_hash != last_hash:
-        logging.info("Codebase changed. Running evaluation logic...")
-        exit_code = run_script(EVAL_SCRIPT)
-        if exit_code == 0:
-            write_hash(current_hash)
-        else:
-            logging.error("evaluation logic failed. Not updating hash.")
+    dev_server = use_dev_server()
+    # The debug reloader runs main() in a watcher process and again in the serving
+    # process; only the serving one starts the evaluation, so it runs once and
+    # /api/eval_status can see it.
+    if dev_server and os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        logging.info("Reloader process. Leaving evaluation logic to the server process.")
+    elif current_hash != last_hash:
+        logging.info("Codebase changed. Running evaluation logic in the background...")
+        # Run the evaluation alongside the dashboard; the hash is written once it succeeds
+        proc = start_script(EVAL_SCRIPT)
+        if proc is not None:
+            app.config['eval_proc'] = proc
+            threading.Thread(
+                target=_wait_and_write_hash, args=(proc, current_hash), daemon=True
+            ).start()
     else:
         logging.info("No code changes detected. Skipping evaluation logic.")
     # Set ImageMagick binary for MoviePy if needed
@@ -287,8 +369,11 @@ def main():
         logging.warning("IMAGEMAGICK_BINARY not set in environment.")
     # Start the dashboard Flask app
     logging.info("Starting highlight approval dashboard...")
-    app = create_app()
-    app.run(host='0.0.0.0', port=8000, debug=True)
+    if dev_server:
+        app.run(host='0.0.0.0', port=8000, debug=True)
+    else:
+        # Multi-threaded so video range requests and API calls are served concurrently
+        serve(app, host='0.0.0.0', port=8000, threads=16, channel_timeout=300)
 
 
 if __name__ == '__main__':
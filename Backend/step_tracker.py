@@ -2,12 +2,17 @@
 Module for tracking and updating the progress of pipeline steps,
 including generating summaries and detailed documentation in project files.
 """
-import os
 from pathlib import Path
-import json
-from datetime import datetime
-import re
-from Backend.utils import document_step
+from Backend.utils import (
+    document_step,
+    iso_now,
+    read_json_cached,
+    read_text_cached,
+    remove_marked_block,
+    remove_step_details,
+    write_json_atomic,
+    write_text_cached,
+)
 
 # Paths for writing progress and documentation in the Dashboard folder
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -32,11 +37,7 @@ def update_step(
     status of the pipeline.
     """
     # Update progress.json
-    if os.path.exists(PROGRESS_PATH):
-        with open(PROGRESS_PATH, "r", encoding="utf-8") as progress_file:
-            progress = json.load(progress_file)
-    else:
-        progress = {}
+    progress = read_json_cached(PROGRESS_PATH)
 
     if step_name not in progress:
         progress[step_name] = []
@@ -48,49 +49,42 @@ def update_step(
             "files_modified": files_modified,
             "prompt": prompt,
             "user_prompt": user_prompt,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "code_refs": code_refs or [],
         }
     )
 
-    with open(PROGRESS_PATH, "w", encoding="utf-8") as progress_file:
-        json.dump(progress, progress_file, indent=2)
+    write_json_atomic(PROGRESS_PATH, progress)
 
     # Update README summary and foldable details
-    if os.path.exists(README_PATH):
-        with open(README_PATH, "r", encoding="utf-8") as readme_file:
-            readme = readme_file.read()
-    else:
-        readme = ""
+    readme = read_text_cached(README_PATH)
 
-    summary_pattern = re.compile(
-        r"<!--SUMMARY_TABLE_START-->.*<!--SUMMARY_TABLE_END-->", re.DOTALL
+    readme = remove_marked_block(
+        readme, "<!--SUMMARY_TABLE_START-->", "<!--SUMMARY_TABLE_END-->"
     )
-    details_pattern = re.compile(
-        rf"<!--STEP_{step_name}_START-->.*" rf"<!--STEP_{step_name}_END-->", re.DOTALL
-    )
-    readme = summary_pattern.sub("", readme)
-    readme = details_pattern.sub("", readme)
+    readme = remove_step_details(readme, step_name)
 
     # Build summary table
-    summary = "<!--SUMMARY_TABLE_START-->\n"
-    summary += "| Step | Status |\n|---|---|\n"
-    for step in progress:
-        latest_status = progress[step][-1]["status"]
-        summary += "| " + str(step) + " | " + str(latest_status) + " |\n"
-    summary += "<!--SUMMARY_TABLE_END-->\n"
+    rows = "".join(
+        f"| {step} | {entries[-1]['status']} |\n" for step, entries in progress.items()
+    )
+    summary = (
+        "<!--SUMMARY_TABLE_START-->\n"
+        "| Step | Status |\n|---|---|\n"
+        f"{rows}"
+        "<!--SUMMARY_TABLE_END-->\n"
+    )
 
     # Insert summary and details at the top
-    step_documentation = (
-        document_step(
-            step_name, status, files_modified, rationale, prompt, user_prompt, code_refs
-        )
-        or ""
+    step_documentation = document_step(
+        step_name,
+        files_modified=files_modified,
+        rationale=rationale,
+        prompt=prompt,
+        status=status,
+        user_prompt=user_prompt,
     )
-    readme = summary + step_documentation + readme
-
-    with open(README_PATH, "w", encoding="utf-8") as readme_file:
-        readme_file.write(readme)
+    write_text_cached(README_PATH, summary, step_documentation, readme)
 
 
 # Example usage:
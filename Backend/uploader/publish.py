@@ -4,19 +4,40 @@ Module for automating upload of final edited videos to target platforms.
 Includes batch-friendly, placeholder implementations to be extended with real APIs.
 """
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[logging.StreamHandler()]
-)
+from typing import Callable, Dict, Any, List
+
 logger = logging.getLogger(__name__)
 
 # Default directory where edited videos are saved
 DEFAULT_EDITED_DIR = Path(__file__).parent.parent / 'video_editing' / 'edited'
+# Maximum number of uploads run at once; uploads are network-bound
+PUBLISH_WORKERS = int(os.environ.get('PUBLISH_WORKERS', '8'))
+
+
+def _upload_youtube(video_path: Path, metadata: Dict[str, Any]) -> bool:
+    """
+    Upload a video to YouTube. Placeholder that simulates success.
+    """
+    logger.debug("Simulating YouTube upload for video: %s", video_path)
+    return True
+
+
+def _upload_tiktok(video_path: Path, metadata: Dict[str, Any]) -> bool:
+    """
+    Upload a video to TikTok. Placeholder that simulates success.
+    """
+    logger.debug("Simulating TikTok upload for video: %s", video_path)
+    return True
+
+
+# Upload handler for each supported platform, keyed on the lowercase platform name
+_UPLOAD_HANDLERS: Dict[str, Callable[[Path, Dict[str, Any]], bool]] = {
+    "youtube": _upload_youtube,
+    "tiktok": _upload_tiktok,
+}
 
 
 def publish_video(video_path: Path, metadata: Dict[str, Any]) -> bool:
@@ -32,24 +53,19 @@ def publish_video(video_path: Path, metadata: Dict[str, Any]) -> bool:
     """
     try:
         # Simulated upload logic for YouTube and TikTok
-        logger.info("Publishing video: %s with metadata: %s", video_path, metadata)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Publishing video: %s with metadata: %s", video_path, metadata)
 
         if "platform" not in metadata:
             logger.error("Metadata must include 'platform' key.")
             return False
 
         platform = metadata["platform"].lower()
-        if platform == "youtube":
-            logger.info("Simulating YouTube upload for video: %s", video_path)
-            # Simulate success
-            return True
-        elif platform == "tiktok":
-            logger.info("Simulating TikTok upload for video: %s", video_path)
-            # Simulate success
-            return True
-        else:
+        handler = _UPLOAD_HANDLERS.get(platform)
+        if handler is None:
             logger.error("Unsupported platform: %s", platform)
             return False
+        return handler(video_path, metadata)
     except (FileNotFoundError, ValueError, RuntimeError) as e:
         logger.error("Failed to publish video %s due to %s: %s", video_path, type(e).__name__, e)
         return False
@@ -59,6 +75,7 @@ def publish_all_videos(edited_dir: Path = DEFAULT_EDITED_DIR,
                        metadata_map: Dict[str, Dict[str, Any]] = None) -> List[Path]:
     """
     Batch publish all videos in the edited directory.
+    Up to PUBLISH_WORKERS uploads run concurrently.
 
     Args:
         edited_dir (Path): Directory containing edited videos.
@@ -66,7 +83,7 @@ def publish_all_videos(edited_dir: Path = DEFAULT_EDITED_DIR,
             If None, uses default empty metadata.
 
     Returns:
-        List[Path]: List of successfully uploaded video paths.
+        List[Path]: List of successfully uploaded video paths, in filename order.
     """
     if metadata_map is None:
         metadata_map = {}
@@ -76,19 +93,36 @@ def publish_all_videos(edited_dir: Path = DEFAULT_EDITED_DIR,
         logger.warning("Edited directory does not exist: %s", edited_dir)
         return success_list
 
-    for video_file in sorted(edited_dir.glob('*.mp4')):
-        meta = metadata_map.get(video_file.name, {})
-        if publish_video(video_file, meta):
-            success_list.append(video_file)
-        else:
-            logger.warning("Skipping failed upload: %s", video_file)
+    # scandir reports the entry type without a separate stat per file
+    with os.scandir(edited_dir) as entries:
+        names = sorted(e.name for e in entries if e.name.lower().endswith('.mp4') and e.is_file())
+    video_files = [edited_dir / name for name in names]
+    if not video_files:
+        return success_list
+    metas = [metadata_map.get(video_file.name, {}) for video_file in video_files]
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(PUBLISH_WORKERS, len(video_files))),
+        thread_name_prefix='publish',
+    ) as executor:
+        for video_file, ok in zip(video_files, executor.map(publish_video, video_files, metas)):
+            if ok:
+                success_list.append(video_file)
+            else:
+                logger.warning("Skipping failed upload: %s", video_file)
     return success_list
 
 
 def main() -> None:
     """
     Entrypoint for the publisher module. Publishes all edited videos.
+    The log level can be set with PUBLISH_LOG_LEVEL (default INFO).
     """
+    # Configure logging only when run as a script, so importers keep their own setup
+    logging.basicConfig(
+        level=os.environ.get('PUBLISH_LOG_LEVEL', 'INFO').upper(),
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[logging.StreamHandler()]
+    )
     uploaded = publish_all_videos()
     logger.info("Uploaded %d videos." , len(uploaded))
 
@@ -4,10 +4,17 @@ Utility module for documenting pipeline steps and managing project progress.
 
 import os
 import json
-from datetime import datetime
-import re
 import logging
-from typing import Dict, List, Optional
+import stat
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 # Config-driven, always-writable temp directory for progress and log state
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,6 +22,209 @@ TEMP_DIR = os.path.join(PROJECT_ROOT, 'temp')
 PROGRESS_PATH = os.path.join(TEMP_DIR, 'progress.json')
 LOG_STATE_PATH = os.path.join(TEMP_DIR, 'evaluation_log_state.json')
 README_PATH = os.path.join(PROJECT_ROOT, 'READMEBUILD.md')
+# Maximum number of files document_step adds code comments to at once
+COMMENT_WORKERS = 8
+
+# Last known text of each documentation file, keyed on path, with the
+# (mtime_ns, size) it had when this process last read or wrote it. Text written
+# by write_text_cached is kept as its parts and only joined if it is read back.
+_text_cache: Dict[str, Tuple[int, int, Union[str, Tuple[str, ...]]]] = {}
+
+
+# Parsed JSON documents (progress.json) by path, stamped like _text_cache
+_json_cache: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def iso_now() -> str:
+    """
+    Return the current local time as an ISO 8601 string with microseconds,
+    like datetime.now().isoformat(), without building a datetime object.
+    """
+    now = time.time()
+    t = time.localtime(now)
+    micros = int((now % 1) * 1_000_000)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{micros:06d}"
+    )
+
+
+def _replace_file(path: str, write: Callable[[IO], None], binary: bool = False) -> None:
+    """
+    Write path through a temp file in the same directory that then replaces it,
+    so readers never see a partially written file. The temp file is given the
+    mode of the file it replaces (0o644 for a new file) instead of mkstemp's 0o600.
+    Raises OSError if the file cannot be written.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", encoding="utf-8")) as f:
+            write(f)
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_text_cached(path: str) -> str:
+    """
+    Return the text of path, or "" if it does not exist. Consecutive calls in
+    one process reuse the cached text until the file's mtime or size changes.
+    """
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _text_cache.pop(key, None)
+        return ""
+    cached = _text_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        text = cached[2]
+        if isinstance(text, tuple):
+            text = "".join(text)
+            _text_cache[key] = (cached[0], cached[1], text)
+        return text
+    with open(key, "r", encoding="utf-8") as f:
+        text = f.read()
+    _text_cache[key] = (st.st_mtime_ns, st.st_size, text)
+    return text
+
+
+def write_text_cached(path: str, *parts: str) -> None:
+    """
+    Atomically write the concatenation of parts to path and remember it, so the
+    next read_text_cached call for path does not read the file back. The parts
+    are written one after another rather than joined into one string first.
+    Raises OSError if the file cannot be written.
+    """
+    key = os.fspath(path)
+    _replace_file(key, lambda f: f.writelines(parts))
+    st = os.stat(key)
+    # Newline translation can make the size on disk differ from the text length
+    _text_cache[key] = (st.st_mtime_ns, st.st_size, parts)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document with orjson when available, falling back to the
+    stdlib. Both raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON bytes with orjson when available, falling back
+    to the stdlib. Output is compact unless indent is set (two spaces).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: str) -> Any:
+    """
+    Load a JSON file, with orjson when available.
+    Raises OSError if the file cannot be read and json.JSONDecodeError
+    (which orjson's error subclasses) if it is not valid JSON.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def read_json_cached(path: str) -> Any:
+    """
+    Load a JSON file for a read-modify-write cycle, or return {} if it does not
+    exist. The parsed object is kept per path and returned again, without
+    re-parsing, until the file's (mtime_ns, size) changes. Callers may mutate it
+    and save it with write_json_atomic, which refreshes the cached stamp.
+    Raises the same errors as read_json.
+    """
+    key = os.fspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _json_cache.pop(key, None)
+        return {}
+    cached = _json_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = read_json(key)
+    _json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """
+    Write data as indented JSON to path. The document is encoded up front and
+    written with a single call to a temp file in the same directory, which then
+    replaces path, so readers never see a partially written file.
+    Raises OSError if the file cannot be written.
+    """
+    encoded = dumps(data, indent=True)
+    key = os.fspath(path)
+    try:
+        _replace_file(key, lambda f: f.write(encoded), binary=True)
+    except BaseException:
+        # data may be a cached object the caller mutated; don't serve it unsaved
+        _json_cache.pop(key, None)
+        raise
+    st = os.stat(key)
+    _json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+
+
+def remove_marked_block(text: str, start_marker: str, end_marker: str) -> str:
+    """
+    Remove every block running from start_marker through the next end_marker.
+    Uses plain substring search on the literal markers, so no regex is involved;
+    a start marker without a matching end marker is left in place.
+    """
+    i = text.find(start_marker)
+    while i != -1:
+        j = text.find(end_marker, i + len(start_marker))
+        if j == -1:
+            break
+        text = text[:i] + text[j + len(end_marker):]
+        i = text.find(start_marker, i)
+    return text
+
+
+def remove_step_details(readme: str, step_name: str) -> str:
+    """
+    Remove the foldable README block of a pipeline step.
+    """
+    return remove_marked_block(
+        readme, f"<!--STEP_{step_name}_START-->", f"<!--STEP_{step_name}_END-->"
+    )
+
+
+def _prepend_comment(file_path: str, comment: str) -> None:
+    """
+    Add comment as the first line of file_path unless the file already starts with it.
+    Only the first len(comment) characters are read when the comment is present.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8") as file:
+            if file.read(len(comment)) == comment:
+                return
+            file.seek(0)
+            content = file.read()
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write(comment + "\n" + content)
+    except (FileNotFoundError, PermissionError, IOError) as e:
+        logging.warning("Could not add comment to %s: %s", file_path, e)
 
 
 def document_step(
@@ -25,23 +235,20 @@ def document_step(
     status: str,
     code_comments: Optional[Dict[str, str]] = None,
     user_prompt: Optional[str] = None,
-) -> None:
+) -> str:
     """
     Appends a detailed, foldable entry for a pipeline step to READMEBUILD.md
     and updates progress.json. Optionally adds code comments to the top of
     each modified file.
     Uses config-driven, always-writable paths for Windows and Docker compatibility.
+    Returns the foldable entry, so other documents can reuse it.
     """
     # Ensure temp dir exists
     os.makedirs(TEMP_DIR, exist_ok=True)
 
     # Update progress.json in temp dir
     try:
-        if os.path.exists(PROGRESS_PATH):
-            with open(PROGRESS_PATH, "r", encoding="utf-8") as progress_file:
-                progress = json.load(progress_file)
-        else:
-            progress = {}
+        progress = read_json_cached(PROGRESS_PATH)
     except (OSError, json.JSONDecodeError) as e:
         logging.warning("Could not read progress.json: %s", e)
         progress = {}
@@ -49,28 +256,20 @@ def document_step(
     progress[step_name] = {
         "status": status,
         "details": rationale,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": iso_now(),
         "files_modified": files_modified,
         "prompt": prompt,
         "user_prompt": user_prompt,
     }
     try:
-        with open(PROGRESS_PATH, "w", encoding="utf-8") as progress_file:
-            json.dump(progress, progress_file, indent=2)
+        write_json_atomic(PROGRESS_PATH, progress)
     except OSError as e:
         logging.error("Could not write progress.json: %s", e)
 
     # Add foldable details to READMEBUILD.md
-    if os.path.exists(README_PATH):
-        with open(README_PATH, "r", encoding="utf-8") as readme_file:
-            readme = readme_file.read()
-    else:
-        readme = ""
-
-    details_pattern = re.compile(
-        rf"<!--STEP_{step_name}_START-->.*<!--STEP_{step_name}_END-->", re.DOTALL
-    )
-    readme = details_pattern.sub("", readme)
+    readme = read_text_cached(README_PATH)
+
+    readme = remove_step_details(readme, step_name)
     details = (
         f"\n<!--STEP_{step_name}_START-->\n"
         f"<details>\n<summary><b>{step_name} ({status})</b></summary>\n\n"
@@ -82,21 +281,16 @@ def document_step(
         f"- **Timestamp:** {progress[step_name]['timestamp']}\n"
         f"</details>\n<!--STEP_{step_name}_END-->\n"
     )
-    readme = details + readme
     try:
-        with open(README_PATH, "w", encoding="utf-8") as readme_file:
-            readme_file.write(readme)
+        write_text_cached(README_PATH, details, readme)
     except OSError as e:
         logging.error("Could not write to READMEBUILD.md: %s", e)
 
     # Optionally add code comments to each file
     if code_comments:
-        for file_path, comment in code_comments.items():
-            try:
-                with open(file_path, "r", encoding="utf-8") as file:
-                    content = file.read()
-                if not content.startswith(comment):
-                    with open(file_path, "w", encoding="utf-8") as file:
-                        file.write(comment + "\n" + content)
-            except (FileNotFoundError, PermissionError, IOError) as e:
-                logging.warning("Could not add comment to %s: %s", file_path, e)
+        with ThreadPoolExecutor(
+            max_workers=min(COMMENT_WORKERS, len(code_comments))
+        ) as executor:
+            list(executor.map(_prepend_comment, code_comments.keys(), code_comments.values()))
+
+    return details
@@ -6,31 +6,73 @@ video files,
 generating subtitles, combining video clips, and adding text-to-speech audio.
 """
 
+import asyncio
+import functools
 import os
-from typing import List
+import re
+import shutil
+import subprocess
+import tempfile
+import textwrap
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import assemblyai as aai  # type: ignore
 # Ensure the requests library is installed and properly imported
 import requests
-import srt_equalizer  # type: ignore
-import yt_dlp  # type: ignore
-from moviepy import *
-from pysrt import open as open_srt
-# Removed unused import: moviepy.video.fx.all as mp
+from termcolor import colored
+from urllib3.util.retry import Retry
+
+# MoviePy, yt_dlp, AssemblyAI and pysrt take seconds to import, so each is
+# imported inside the functions that use it; the Twitch helpers never pay
+# for them.
 # SubtitlesClip is not available in latest MoviePy;
 # subtitle overlay will need a custom implementation or alternative library.
-from termcolor import colored
+if TYPE_CHECKING:
+    from moviepy import TextClip, VideoClip, VideoFileClip
+    from pysrt import SubRipFile
+
+try:
+    import edge_tts  # type: ignore
+except ImportError:
+    edge_tts = None
 
 TWITCH_CLIENT_ID = os.getenv("TWITCH_CLIENT_ID")
 TWITCH_ACCESS_TOKEN = os.getenv("TWITCH_ACCESS_TOKEN")
 TWITCH_CHANNEL_ID = "zepor1"
-
-
-def fetch_twitch_videos(
+# Maximum number of videos save_video downloads at once
+DOWNLOAD_WORKERS = int(os.getenv("DOWNLOAD_WORKERS", "8"))
+# Fragments yt_dlp fetches in parallel within each download
+FRAGMENT_WORKERS = int(os.getenv("FRAGMENT_WORKERS", "4"))
+# Shared keep-alive session for the Twitch Helix API. Rate limiting (429)
+# and transient server errors are retried with backoff; once retries run out
+# the last response is returned so the status check below still applies.
+_TWITCH_SESSION = requests.Session()
+_TWITCH_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
+# Helix video listings are reused for this many seconds, so back-to-back
+# fetches in one run share a request while new VODs still show up later
+TWITCH_CACHE_TTL = 60
+_twitch_cache: Dict[Tuple[str, str, str], Tuple[float, Tuple[dict, ...]]] = {}
+
+
+def _fetch_twitch_video_records(
     client_id: str, access_token: str, channel_id: str
-) -> List[str]:
+) -> List[dict]:
     """
-    Fetches all video URLs from a Twitch channel.
+    Fetches the video records of a Twitch channel with a single Helix request.
+    Successful responses are cached for TWITCH_CACHE_TTL seconds.
 
     Args:
         client_id (str): Twitch client ID.
@@ -38,8 +80,13 @@ def fetch_twitch_videos(
         channel_id (str): Twitch channel ID.
 
     Returns:
-        List[str]: List of video URLs.
+        List[dict]: The "data" records of the response, or an empty list on failure.
     """
+    key = (client_id, access_token, channel_id)
+    cached = _twitch_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < TWITCH_CACHE_TTL:
+        return list(cached[1])
+
     headers = {
         "Client-ID": client_id,
         "Authorization": f"Bearer {access_token}",
@@ -48,14 +95,33 @@ def fetch_twitch_videos(
         f"https://api.twitch.tv/helix/videos?"
         f"user_id={channel_id}&sort=time&type=all"
     )
-    response = requests.get(url, headers=headers, timeout=10)
+    response = _TWITCH_SESSION.get(url, headers=headers, timeout=10)
 
     if response.status_code != 200:
         print(colored(f"Failed to fetch videos: {response.status_code}", "red"))
         return []  # Return an empty list in case of failure
 
-    data = response.json()
-    return [video["url"] for video in data.get("data", [])]
+    records = tuple(response.json().get("data", []))
+    _twitch_cache[key] = (time.monotonic(), records)
+    return list(records)
+
+
+def fetch_twitch_videos(
+    client_id: str, access_token: str, channel_id: str
+) -> List[str]:
+    """
+    Fetches all video URLs from a Twitch channel.
+
+    Args:
+        client_id (str): Twitch client ID.
+        access_token (str): Twitch access token.
+        channel_id (str): Twitch channel ID.
+
+    Returns:
+        List[str]: List of video URLs.
+    """
+    records = _fetch_twitch_video_records(client_id, access_token, channel_id)
+    return [video["url"] for video in records]
 
 
 def fetch_twitch_video_titles(
@@ -72,74 +138,164 @@ def fetch_twitch_video_titles(
     Returns:
         List[str]: List of video titles.
     """
-    headers = {
-        "Client-ID": client_id,
-        "Authorization": f"Bearer {access_token}",
-    }
-    url = (
-        f"https://api.twitch.tv/helix/videos?"
-        f"user_id={channel_id}&sort=time&type=all"
-    )
-    response = requests.get(url, headers=headers, timeout=10)
+    records = _fetch_twitch_video_records(client_id, access_token, channel_id)
+    return [video["title"] for video in records]
 
-    if response.status_code != 200:
-        print(colored(f"Failed to fetch video titles: {response.status_code}", "red"))
-        return []  # Ensure a list is returned even in error cases
 
-    data = response.json()
-    return [video["title"] for video in data.get("data", [])]
+def download_video(url: str, idx: int = 1) -> str:
+    """
+    Downloads a single video and saves it to the local filesystem.
 
+    Args:
+        url (str): The video URL to download.
+        idx (int): Position of the video, used in the filename if it has no title.
 
-def save_video(urls: List[str]) -> List[str]:
+    Returns:
+        str: The file path where the video is saved.
+    """
+    import yt_dlp  # type: ignore
+
+    # One extractor pass: yt_dlp fills in upload date and title from the
+    # output template, and restrictfilenames keeps the name filesystem-safe
+    ydl_opts = {
+        "outtmpl": (
+            f"./temp/%(upload_date|unknown_date)s_%(title|video_{idx}).100B.mp4"
+        ),
+        "restrictfilenames": True,
+        "format": "best",
+        "quiet": True,
+        # HLS VODs are downloaded as fragments; fetch several at once
+        "concurrent_fragment_downloads": FRAGMENT_WORKERS,
+    }
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        print(colored(f"Downloading video: {url}", "blue"))
+        info = ydl.extract_info(url, download=True)
+        downloads = info.get("requested_downloads") or []
+        if downloads and downloads[0].get("filepath"):
+            output_path = downloads[0]["filepath"]
+        else:
+            output_path = ydl.prepare_filename(info)
+    print(colored(f"Saved video to: {output_path}", "green"))
+    return output_path
+
+
+def save_video(urls: List[str], max_workers: int = DOWNLOAD_WORKERS) -> List[str]:
     """
     Downloads videos from the provided URLs and saves them to the local
-    filesystem.
+    filesystem. Up to max_workers downloads run at once.
 
     Args:
         urls (List[str]): A list of video URLs to download.
+        max_workers (int, optional): Maximum number of concurrent downloads.
+            Defaults to DOWNLOAD_WORKERS.
+
+    Returns:
+        List[str]: A list of file paths where the videos are saved, in the
+        same order as urls.
+    """
+    if not urls:
+        return []
+    # Downloads are network-bound, so threads overlap them well
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(urls))), thread_name_prefix="download"
+    ) as executor:
+        return list(executor.map(download_video, urls, range(1, len(urls) + 1)))
+
+
+# Voice used for all speech (professional Canadian accent)
+TTS_VOICE = "en-CA-LiamNeural"
+# Maximum number of edge-tts requests in flight at once
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+async def _synthesize_all(texts: List[str], paths: List[str], voice: str) -> None:
+    """
+    Synthesize every text to its path concurrently with edge_tts.
+    """
+    semaphore = asyncio.Semaphore(TTS_CONCURRENCY)
+
+    async def synthesize(text: str, path: str) -> None:
+        async with semaphore:
+            await edge_tts.Communicate(text, voice).save(path)
+
+    await asyncio.gather(*[synthesize(text, path) for text, path in zip(texts, paths)])
+
+
+def _join_audio(paths: List[str], output_path: str) -> None:
+    """
+    Join MP3 files end to end with ffmpeg's concat demuxer, without
+    re-encoding. Without ffmpeg the files are appended byte for byte, which
+    plays correctly for the bare MP3 frame streams edge-tts produces.
+    """
+    list_path = os.path.join(os.path.dirname(os.path.abspath(paths[0])), "concat.txt")
+    with open(list_path, "w", encoding="utf-8") as list_file:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            list_file.write(f"file '{escaped}'\n")
+    try:
+        subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+             "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", output_path],
+            check=True,
+        )
+    except FileNotFoundError:
+        with open(output_path, "wb") as output:
+            for path in paths:
+                with open(path, "rb") as part:
+                    shutil.copyfileobj(part, output)
+    finally:
+        os.remove(list_path)
+
+
+def _synthesize_cli(text: str, path: str, voice: str) -> None:
+    """
+    Synthesize one text with the edge-tts command line tool. Arguments are
+    passed as a list, so the text never goes through a shell.
+    """
+    try:
+        subprocess.run(
+            ["edge-tts", "--voice", voice, "--text", text, "--write-media", path],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except subprocess.CalledProcessError as e:
+        print(colored(f"[-] edge-tts failed: {e.stderr.strip()}", "red"))
+        raise
+
+
+def text_to_speech_batch(
+    texts: List[str], paths: List[str], voice: str = TTS_VOICE
+) -> List[str]:
+    """
+    Converts several texts to speech, one audio file per text.
+    With the edge_tts package installed the requests run concurrently
+    in-process; otherwise each text falls back to the edge-tts CLI.
+
+    Args:
+        texts (list): The texts to be converted into speech.
+        paths (list): The output file path for each text.
+        voice (str, optional): The edge-tts voice to use.
 
     Returns:
-        List[str]: A list of file paths where the videos are saved.
-    """
-    saved_paths = []
-    for idx, url in enumerate(urls, 1):
-        # Fetch video info using yt_dlp to get title and upload date
-        with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
-            try:
-                info = ydl.extract_info(url, download=False)
-                # Use upload_date and title for filename
-                if info:
-                    upload_date = info.get("upload_date", "unknown_date")
-                    title = info.get("title", f"video_{idx}")
-                else:
-                    upload_date = "unknown_date"
-                    title = f"video_{idx}"
-                # Clean title for filesystem
-                safe_title = "".join(
-                    c for c in title if c.isalnum() or c in (" ", "_", "-")
-                ).rstrip()
-                filename = f"{upload_date}_{safe_title}.mp4"
-            except yt_dlp.utils.DownloadError as e:
-                print(colored(f"Failed to get info for {url}: {e}", "red"))
-                filename = f"video_{idx}.mp4"
-
-        output_path = f"./temp/{filename}"
-        ydl_opts = {
-            "outtmpl": output_path,
-            "format": "best",
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(colored(f"Downloading video: {url}", "blue"))
-            ydl.download([url])
-        print(colored(f"Saved video to: {output_path}", "green"))
-        saved_paths.append(output_path)
-    return saved_paths
-
-
-# Define a function to speak text using edge-tts
+        list: The file paths where the audio files are saved.
+    """
+    if len(texts) != len(paths):
+        raise ValueError("texts and paths must have the same length")
+    if edge_tts is None:
+        for text, path in zip(texts, paths):
+            _synthesize_cli(text, path, voice)
+    else:
+        asyncio.run(_synthesize_all(texts, paths, voice))
+    return list(paths)
+
+
 def text_to_speech(text: str, output_path_location: str = "output.mp3") -> str:
     """
     Converts the given text to speech and saves it as an audio file.
+    With edge_tts installed, multi-sentence texts are synthesized one
+    sentence per request, concurrently, and joined into the output file.
 
     Args:
         text (str): The text to be converted into speech.
@@ -149,85 +305,250 @@ def text_to_speech(text: str, output_path_location: str = "output.mp3") -> str:
     Returns:
         str: The file path where the audio file is saved.
     """
-    # Choose the voice for the speech (professional Canadian accent)
-    voice = "en-CA-LiamNeural"
-
-    # Build the edge-tts command string, including voice, text,
-    # and output media
-    command = (
-        f'edge-tts --voice "{voice}" '
-        f'--text "{text}" '
-        f'--write-media "{output_path_location}"'
-    )
+    sentences = [s for s in _SENTENCE_END_RE.split(text.strip()) if s]
+    if edge_tts is None or len(sentences) < 2:
+        return text_to_speech_batch([text], [output_path_location])[0]
 
-    # Execute the edge-tts command using the system shell
-    os.system(command)
+    with tempfile.TemporaryDirectory(prefix="tts_") as chunk_dir:
+        chunk_paths = [
+            os.path.join(chunk_dir, f"chunk_{i}.mp3") for i in range(len(sentences))
+        ]
+        text_to_speech_batch(sentences, chunk_paths)
+        _join_audio(chunk_paths, output_path_location)
 
     return output_path_location
 
 
-def generate_subtitles(
-    audio_path: str, assembly_ai_api_key: str, directory: str = "./subtitles"
-) -> str:
+# AssemblyAI requests are retried with exponential backoff (1s, 2s, 4s, ...
+# capped at TRANSCRIBE_MAX_WAIT) to ride out rate limiting and network errors
+TRANSCRIBE_ATTEMPTS = 5
+TRANSCRIBE_MAX_WAIT = 30
+# Transcriptions run here so the caller can keep working while AssemblyAI
+# processes the audio
+_TRANSCRIBE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcribe")
+
+
+def _transcribe_with_retry(audio_path: str, assembly_ai_api_key: str):
     """
-    Generates subtitles from a given audio file and
-    returns the path to the subtitles.
+    Transcribe audio_path with AssemblyAI, retrying failed requests.
+    """
+    import assemblyai as aai  # type: ignore
+
+    aai.settings.api_key = assembly_ai_api_key
+    transcriber = aai.Transcriber()
+    for attempt in range(TRANSCRIBE_ATTEMPTS):
+        try:
+            transcript = transcriber.transcribe(audio_path)
+        except Exception as e:  # pylint: disable=broad-except
+            if attempt == TRANSCRIBE_ATTEMPTS - 1:
+                raise
+            wait = min(2 ** attempt, TRANSCRIBE_MAX_WAIT)
+            print(
+                colored(f"[-] Transcription failed ({e}), retrying in {wait}s.", "yellow")
+            )
+            time.sleep(wait)
+            continue
+        if transcript.status == aai.TranscriptStatus.error:
+            raise RuntimeError(f"Transcription failed: {transcript.error}")
+        return transcript
+    raise RuntimeError("Transcription failed")
+
+
+def submit_transcription(audio_path: str, assembly_ai_api_key: str) -> Future:
+    """
+    Start transcribing an audio file in the background.
 
     Args:
-        audio_path (str): The path to the audio file to generate subtitles
-            from.
+        audio_path (str): The path to the audio file to transcribe.
+        assembly_ai_api_key (str): The AssemblyAI API key.
 
     Returns:
-        str: The path to the generated subtitles.
+        Future: Resolves to the AssemblyAI transcript; pass it to
+            finalize_subtitles.
     """
+    return _TRANSCRIBE_EXECUTOR.submit(
+        _transcribe_with_retry, audio_path, assembly_ai_api_key
+    )
 
-    def equalize_subtitles(srt_path: str, max_chars: int = 10) -> None:
-        # Equalize subtitles
-        srt_equalizer.equalize_srt_file(srt_path, srt_path, max_chars)
 
-    print(assembly_ai_api_key)
+def equalize_subtitles(subtitles: "SubRipFile", max_chars: int = 10) -> "SubRipFile":
+    """
+    Split subtitles into chunks of at most max_chars characters, breaking on
+    whitespace. Each chunk gets a share of its subtitle's time span
+    proportional to its length.
 
-    aai.settings.api_key = assembly_ai_api_key
+    Args:
+        subtitles (SubRipFile): The subtitles to split.
+        max_chars (int, optional): Maximum characters per chunk. Defaults to 10.
 
-    transcriber = aai.Transcriber()
+    Returns:
+        SubRipFile: The equalized subtitles.
+    """
+    from pysrt import SubRipFile, SubRipItem, SubRipTime
+
+    items = []
+    for subtitle in subtitles:
+        chunks = textwrap.wrap(subtitle.text, max_chars, break_long_words=False) or [""]
+        start = subtitle.start.ordinal
+        span = subtitle.end.ordinal - start
+        total = sum(len(chunk) for chunk in chunks) or 1
+        done = 0
+        for chunk in chunks:
+            chunk_start = start + span * done // total
+            done += len(chunk)
+            chunk_end = start + span * done // total
+            items.append(
+                SubRipItem(
+                    index=len(items) + 1,
+                    start=SubRipTime.from_ordinal(chunk_start),
+                    end=SubRipTime.from_ordinal(chunk_end),
+                    text=chunk,
+                )
+            )
+    return SubRipFile(items=items)
+
+
+def finalize_subtitles(transcript_future: Future, directory: str = "./subtitles") -> str:
+    """
+    Wait for a transcription started by submit_transcription and write it
+    out as an equalized SRT file.
+
+    Args:
+        transcript_future (Future): The future returned by submit_transcription.
+        directory (str, optional): The directory to write the subtitles to.
 
-    transcript = transcriber.transcribe(audio_path)
+    Returns:
+        str: The path to the generated subtitles.
+    """
+    from pysrt import from_string as srt_from_string
+
+    transcript = transcript_future.result()
 
     os.makedirs(directory, exist_ok=True)
     # Save subtitles
     subtitles_path = f"{directory}/audio.srt"
 
-    subtitles = transcript.export_subtitles_srt()
-
-    with open(subtitles_path, "w", encoding="utf-8") as subtitle_file:
-        subtitle_file.write(subtitles)
-
-    # Equalize subtitles
-    equalize_subtitles(subtitles_path)
+    # Equalize the subtitles in memory and write the file once
+    subtitles = equalize_subtitles(srt_from_string(transcript.export_subtitles_srt()))
+    subtitles.save(subtitles_path, encoding="utf-8")
 
     print(colored("[+] Subtitles generated.", "green"))
 
     return subtitles_path
 
 
-def concatenate_clips_sequentially(clips: list[VideoFileClip]) -> CompositeVideoClip:
+def generate_subtitles(
+    audio_path: str, assembly_ai_api_key: str, directory: str = "./subtitles"
+) -> str:
     """
-    Concatenate a list of VideoFileClip objects sequentially into a single CompositeVideoClip.
+    Generates subtitles from a given audio file and
+    returns the path to the subtitles.
+
+    To overlap the transcription with other work, call submit_transcription
+    early and finalize_subtitles once the subtitles are needed.
+
+    Args:
+        audio_path (str): The path to the audio file to generate subtitles
+            from.
+
+    Returns:
+        str: The path to the generated subtitles.
+    """
+    return finalize_subtitles(
+        submit_transcription(audio_path, assembly_ai_api_key), directory
+    )
+
+
+def concatenate_clips_sequentially(clips: "list[VideoFileClip]") -> "VideoClip":
+    """
+    Concatenate a list of VideoFileClip objects sequentially into a single clip.
+    The clips must share one size; "chain" reads only the clip playing at
+    each moment instead of compositing every clip onto every frame.
     Args:
         clips (list[VideoFileClip]): List of video clips to concatenate.
     Returns:
-        CompositeVideoClip: The concatenated video clip.
+        VideoClip: The concatenated video clip.
     """
-    t = 0
-    new_clips = []
-    for clip in clips:
-        clip = clip.set_start(t)
-        t += clip.duration
-        new_clips.append(clip)
-    return CompositeVideoClip(new_clips)
+    from moviepy import concatenate_videoclips
 
+    return concatenate_videoclips(clips, method="chain")
 
-def combine_videos(video_paths: List[str], max_duration: int) -> str:
+
+# H.264 encoders to try, fastest first, with their quality settings.
+# libx264 is the always-available software fallback. It keeps x264's default
+# "medium" preset; X264_PRESET trades file size and quality for speed.
+_H264_ENCODERS = (
+    ("h264_nvenc", ["-preset", "p4", "-rc", "vbr", "-cq", "23"]),
+    ("h264_qsv", ["-global_quality", "23"]),
+    ("h264_videotoolbox", ["-q:v", "65"]),
+)
+_SOFTWARE_ENCODER = ("libx264", ["-preset", os.getenv("X264_PRESET", "medium")])
+
+
+@functools.lru_cache(maxsize=1)
+def _pick_encoder() -> Tuple[str, Tuple[str, ...]]:
+    """
+    Return (codec, ffmpeg params) for the fastest usable H.264 encoder.
+    An encoder listed by ffmpeg can still be unusable (e.g. no GPU), so each
+    hardware candidate is checked with a tiny test encode. Probed once per process.
+    """
+    try:
+        listing = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        listing = ""
+    for codec, params in _H264_ENCODERS:
+        if codec not in listing:
+            continue
+        probe = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+             "-c:v", codec, *params, "-f", "null", "-"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+        )
+        if probe.returncode == 0:
+            print(colored(f"[+] Using hardware encoder {codec}.", "blue"))
+            return codec, tuple(params)
+    return _SOFTWARE_ENCODER[0], tuple(_SOFTWARE_ENCODER[1])
+
+
+def _combine_videos_ffmpeg(
+    video_paths: List[str], clip_duration: float, output_path: str
+) -> None:
+    """
+    Trims, center-crops to 9:16, scales to 1080x1920 at 30 fps and concatenates
+    the videos with a single ffmpeg filtergraph, without decoding frames in Python.
+
+    Raises:
+        FileNotFoundError: If ffmpeg is not installed.
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    cmd = ["ffmpeg", "-hide_banner", "-nostats", "-y"]
+    for video_path in video_paths:
+        cmd += ["-i", video_path]
+    filters = [
+        f"[{i}:v]trim=0:{clip_duration},setpts=PTS-STARTPTS,"
+        "crop=w='min(iw,ih*9/16)':h='min(ih,iw*16/9)',"
+        f"scale=1080:1920,setsar=1,fps=30[v{i}]"
+        for i in range(len(video_paths))
+    ]
+    inputs = "".join(f"[v{i}]" for i in range(len(video_paths)))
+    filters.append(f"{inputs}concat=n={len(video_paths)}:v=1:a=0[out]")
+    codec, params = _pick_encoder()
+    cmd += [
+        "-filter_complex", ";".join(filters),
+        "-map", "[out]", "-an",
+        "-c:v", codec, *params, "-threads", "0",
+        output_path,
+    ]
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+
+
+def combine_videos(
+    video_paths: List[str], max_duration: int, use_ffmpeg: bool = True
+) -> str:
     """
     Combines a list of videos into one video and
     returns the path to the combined video.
@@ -235,49 +556,193 @@ def combine_videos(video_paths: List[str], max_duration: int) -> str:
     Args:
         video_paths (list): A list of paths to the videos to combine.
         max_duration (int): The maximum duration of the combined video.
+        use_ffmpeg (bool, optional): Build the video with one ffmpeg
+            filtergraph. Falls back to MoviePy if False or if ffmpeg is not
+            installed. Defaults to True.
 
     Returns:
         str: The path to the combined video.
     """
     combined_video_path = "./temp/combined_video.mp4"
+    clip_duration = max_duration / len(video_paths)
 
     print(colored("[+] Combining videos...", "blue"))
     print(
         colored(
             f"[+] Each video will be "
-            f"{max_duration / len(video_paths)} seconds long.",
+            f"{clip_duration} seconds long.",
             "blue",
         )
     )
 
+    if use_ffmpeg:
+        try:
+            _combine_videos_ffmpeg(video_paths, clip_duration, combined_video_path)
+            return combined_video_path
+        except FileNotFoundError:
+            print(colored("[-] ffmpeg not found, combining with MoviePy.", "yellow"))
+
+    from moviepy import VideoFileClip
+    from moviepy.video.fx import Crop
+    from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+    sources = []
     clips = []
     for video_path in video_paths:
-        clip = VideoFileClip(video_path)
-        clip = clip.without_audio()
-        clip = clip.subclip(0, max_duration / len(video_path))
-        clip = clip.set_fps(30)
-
-        # Not all videos are same size,
-        # so we need to resize them
-        clip = crop(
-            clip, width=1080, height=1920, x_center=clip.w / 2, y_center=clip.h / 2
+        # Have the ffmpeg reader scale the shorter side straight to the
+        # 1080x1920 frame, so only output-sized frames reach Python.
+        # MoviePy 2.x takes target_resolution as (width, height).
+        width, height = ffmpeg_parse_infos(video_path)["video_size"]
+        if width * 1920 > height * 1080:
+            target_resolution = (None, 1920)
+        else:
+            target_resolution = (1080, None)
+        clip = VideoFileClip(
+            video_path, target_resolution=target_resolution, audio=False
         )
-        clip = clip.resize((1080, 1920))
+        sources.append(clip)
+        clip = clip.with_subclip(0, clip_duration)
+        clip = clip.with_fps(30)
+
+        # Trim whatever overhangs the 9:16 frame
+        if (clip.w, clip.h) != (1080, 1920):
+            clip = clip.with_effects(
+                [Crop(width=1080, height=1920, x_center=clip.w / 2, y_center=clip.h / 2)]
+            )
 
         clips.append(clip)
 
-    final_clip = concatenate_clips_sequentially(clips)
-    final_clip = final_clip.set_fps(30)
-    final_clip.write_videofile(combined_video_path, threads=3)
+    try:
+        final_clip = concatenate_clips_sequentially(clips)
+        final_clip = final_clip.with_fps(30)
+        codec, params = _pick_encoder()
+        final_clip.write_videofile(
+            combined_video_path, codec=codec, ffmpeg_params=list(params), threads=0
+        )
+    finally:
+        # Stop each source's ffmpeg reader now rather than at garbage collection
+        for source in sources:
+            source.close()
 
     return combined_video_path
 
 
+# Caption font, shared by the MoviePy and ffmpeg subtitle renderers
+SUBTITLE_FONT = os.path.join("MoneyPrinter", "fonts", "bold_font.ttf")
+
+
+@functools.lru_cache(maxsize=512)
+def _subtitle_text_clip(txt: str) -> "TextClip":
+    """
+    Render one subtitle caption. Repeated captions reuse the same base clip,
+    which is safe because with_start/with_duration return copies.
+    """
+    from moviepy import TextClip
+
+    return TextClip(
+        font=SUBTITLE_FONT,
+        text=txt,
+        font_size=100,
+        color="#FFFF00",
+        stroke_color="black",
+        stroke_width=5,
+    )
+
+
+# libass style matching the MoviePy captions: centred yellow text with a
+# black outline in SUBTITLE_FONT (see _subtitle_font_style). Sizes are in
+# libass's default 288-line script space, so Fontsize 15 and Outline 0.75
+# equal 100 px text with a 5 px stroke at 1920.
+SUBTITLE_STYLE = (
+    "Bold=1,Fontsize=15,PrimaryColour=&H0000FFFF&,OutlineColour=&H00000000&,"
+    "BorderStyle=1,Outline=0.75,Shadow=0,Alignment=5"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_has_subtitles_filter() -> bool:
+    """
+    Return True if ffmpeg is installed and built with libass, which provides
+    the subtitles filter. Probed once per process.
+    """
+    try:
+        filters = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-filters"],
+            capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    return any(line.split()[1:2] == ["subtitles"] for line in filters.splitlines())
+
+
+def _filter_path(path: str) -> str:
+    """
+    Escape a file path for use as an ffmpeg filter option value. Filter
+    options treat ':' and '\\' specially, so use forward slashes and escape
+    the colon of a Windows drive letter.
+    """
+    return os.path.abspath(path).replace("\\", "/").replace(":", "\\:")
+
+
+@functools.lru_cache(maxsize=1)
+def _subtitle_font_style() -> Tuple[str, str]:
+    """
+    Return the subtitles filter options that make libass use SUBTITLE_FONT:
+    a fontsdir option and a Fontname style override. The family name is read
+    from the font file with Pillow unless SUBTITLE_FONT_NAME is set. Both are
+    empty if the font file is missing, leaving libass on its default font.
+    """
+    if not os.path.isfile(SUBTITLE_FONT):
+        print(colored(f"[-] Subtitle font not found: {SUBTITLE_FONT}", "yellow"))
+        return "", ""
+    family = os.getenv("SUBTITLE_FONT_NAME")
+    if not family:
+        try:
+            from PIL import ImageFont
+
+            family = ImageFont.truetype(SUBTITLE_FONT).getname()[0]
+        except (ImportError, OSError):
+            family = None
+    fontsdir = f":fontsdir='{_filter_path(os.path.dirname(SUBTITLE_FONT))}'"
+    return fontsdir, f",Fontname={family}" if family else ""
+
+
+def _render_video_ffmpeg(
+    combined_video_path: str, tts_path: str, subtitles_path: str, output_path: str
+) -> None:
+    """
+    Burns the subtitles into the combined video with ffmpeg's libass
+    subtitles filter and muxes in the speech audio, in one ffmpeg pass.
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails.
+    """
+    fontsdir, fontname = _subtitle_font_style()
+    subtitles_filter = (
+        f"subtitles='{_filter_path(subtitles_path)}'{fontsdir}"
+        f":force_style='{SUBTITLE_STYLE}{fontname}'"
+    )
+    codec, params = _pick_encoder()
+    cmd = [
+        "ffmpeg", "-hide_banner", "-nostats", "-y",
+        "-i", combined_video_path,
+        "-i", tts_path,
+        "-map", "0:v", "-map", "1:a",
+        "-vf", subtitles_filter,
+        "-c:v", codec, *params, "-threads", "0",
+        "-c:a", "aac", "-shortest",
+        output_path,
+    ]
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+
+
 def generate_video(
     combined_video_path: str,
     tts_path: str,
     subtitles_path: str,
     output_file_name: str = "main_output.mp4",
+    combined_clip: Optional["VideoFileClip"] = None,
+    use_ffmpeg: bool = True,
 ) -> str:
     """
     This function creates the final video, with subtitles and audio.
@@ -286,24 +751,27 @@ def generate_video(
         combined_video_path (str): The path to the combined video.
         tts_path (str): The path to the text-to-speech audio.
         subtitles_path (str): The path to the subtitles.
+        combined_clip (VideoFileClip, optional): An already open clip of the
+            combined video, for the MoviePy path. If omitted,
+            combined_video_path is opened once here and closed when
+            rendering finishes.
+        use_ffmpeg (bool, optional): Burn in the subtitles with ffmpeg's
+            libass filter. Falls back to MoviePy if False, if a clip is
+            passed in, or if ffmpeg lacks libass. Defaults to True.
 
     Returns:
         str: The path to the final video.
     """
 
-    # Make a generator that returns a TextClip when called with consecutive
-    def generator(txt):
-        return TextClip(
-            txt,
-            font=r"MoneyPrinter\fonts\bold_font.ttf",
-            fontsize=100,
-            color="#FFFF00",
-            stroke_color="black",
-            stroke_width=5,
-        )
-
     # Burn the subtitles into the video
+    if use_ffmpeg and combined_clip is None and _ffmpeg_has_subtitles_filter():
+        _render_video_ffmpeg(
+            combined_video_path, tts_path, subtitles_path, "./temp/output.mp4"
+        )
+        return output_file_name
 
+    from moviepy import AudioFileClip, CompositeVideoClip, VideoFileClip
+    from pysrt import open as open_srt
 
     # Parse the subtitles file
     subtitles = open_srt(subtitles_path)
@@ -313,24 +781,38 @@ def generate_video(
     for subtitle in subtitles:
         start_time = subtitle.start.ordinal / 1000  # Convert to seconds
         end_time = subtitle.end.ordinal / 1000  # Convert to seconds
-        text_clip = generator(subtitle.text).set_start(
-            start_time).set_duration(end_time - start_time)
+        text_clip = _subtitle_text_clip(subtitle.text).with_start(
+            start_time).with_duration(end_time - start_time)
         subtitle_clips.append(text_clip)
 
     # Combine all subtitle clips into a CompositeVideoClip
     subtitles = CompositeVideoClip(subtitle_clips)
-    result = CompositeVideoClip(
-        [
-            VideoFileClip(combined_video_path),
-            subtitles.set_position(("center", "center")),
-        ]
-    )
 
-    # Add the audio
+    # Open the combined video once; each VideoFileClip starts its own
+    # ffmpeg reader process
+    owns_clip = combined_clip is None
+    video = VideoFileClip(combined_video_path) if owns_clip else combined_clip
     audio = AudioFileClip(tts_path)
-    result = result.set_audio(audio)
+    try:
+        result = CompositeVideoClip(
+            [
+                video,
+                subtitles.with_position(("center", "center")),
+            ]
+        )
 
-    result.write_videofile("./temp/output.mp4", threads=3)
+        # Add the audio
+        result = result.with_audio(audio)
+
+        codec, params = _pick_encoder()
+        result.write_videofile(
+            "./temp/output.mp4", codec=codec, ffmpeg_params=list(params), threads=0
+        )
+    finally:
+        audio.close()
+        if owns_clip:
+            video.close()
+        _subtitle_text_clip.cache_clear()
 
     return output_file_name
 
@@ -347,13 +829,10 @@ def list_files_in_directory(directory):
         FileNotFoundError: If the specified directory does not exist.
     """
     try:
-        # Get a list of all files in the specified directory
-        files = [
-            file_name
-            for file_name in os.listdir(directory)
-            if os.path.isfile(os.path.join(directory, file_name))
-        ]
-        return files
+        # Get a list of all files in the specified directory; scandir's
+        # cached entry type avoids a stat() per file
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
 
     except FileNotFoundError:
         print("Directory not found: " + str(directory))
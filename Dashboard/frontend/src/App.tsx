@@ -257,7 +257,14 @@ function App() {
           return;
       }
       const res = await fetch(url, { method: 'POST' });
-      const data = await res.json();
+      let data = await res.json();
+      if (step === 'ingest' && res.status === 202 && data.job_id) {
+        // Ingestion runs in the background; poll until the job finishes
+        while (data.status === 'started' || data.status === 'queued' || data.status === 'running') {
+          await new Promise((resolve) => setTimeout(resolve, 2000));
+          data = await (await fetch(`/api/ingest/${data.job_id}`)).json();
+        }
+      }
       if (data.status === 'success') {
         setStatus(`${step} completed successfully.`);
         fetchPipelineStatus();